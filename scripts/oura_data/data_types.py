@@ -0,0 +1,263 @@
+# -------------------------------------------------------
+#  Oura Data Type Registry
+# -------------------------------------------------------
+#   Single place that describes every Oura data type we handle:
+#     - which OuraClient method fetches it
+#     - which CSV file it is saved to
+#     - which SQL file / Supabase table it ends up in
+#     - how CSV columns map onto table columns (used by validate_data.py)
+#
+#   This module only uses the standard library so it is cheap to
+#   import from any subcommand.
+# -------------------------------------------------------
+
+# Seconds in a day, for the daily summary sync interval
+DAILY = 24 * 60 * 60
+
+# Each "columns" entry is (table column, CSV column(s), type, rule):
+#   type: text, date, timestamp, int, float or json
+#   rule: "required" - CSV column must exist and every value must be set (NOT NULL)
+#         "nullable" - CSV column must exist, empty values become NULL
+#         "optional" - CSV column may be missing, it is then left out of the INSERT
+#   CSV column can be a tuple of alternative names; the first one found is used.
+#
+# "conflict_key" is the table's UNIQUE constraint: inserts update the existing row
+# on conflict. Tables without one skip rows that hit any other unique constraint.
+#
+# "sync_*" keys are used by the serve subcommand (sync_daemon.py): how often to pull
+# (seconds), how many days back each pull covers, and which table column identifies
+# a row that has already been pushed.
+#
+# Order matters: fetch, prepare and load all walk the types in this order.
+DATA_TYPES = {
+    "sleep": {
+        "label": "sleep",
+        "client_method": "get_daily_sleep",
+        "csv_file": "sleep_data.csv",
+        "sql_file": "sleep_inserts.sql",
+        "table": "oura_sleep",
+        "conflict_key": ("day",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("score", "score", "int", "nullable"),
+            ("contributors", "contributors", "json", "nullable"),
+            ("timestamp", "timestamp", "timestamp", "nullable"),
+        ],
+    },
+    "heart_rate": {
+        "label": "heart rate",
+        "client_method": "get_heart_rate",
+        # Heart rate is queried by datetime, not by day
+        "date_params": ("start_datetime", "end_datetime"),
+        # Retry without a date range if the datetime parameters are rejected
+        "retry_without_dates": True,
+        "csv_file": "heart_rate_data.csv",
+        "sql_file": "heart_rate_inserts.sql",
+        "table": "oura_heart_rate",
+        # serve: heart rate is pulled every 15 minutes, keyed by sample time
+        "sync_interval": 15 * 60,
+        "sync_lookback_days": 1,
+        "sync_key": "timestamp",
+        "columns": [
+            ("bpm", "bpm", "int", "required"),
+            ("source", "source", "text", "nullable"),
+            ("timestamp", "timestamp", "timestamp", "required"),
+            ("type", "type", "text", "optional"),
+        ],
+    },
+    "activity": {
+        "label": "activity",
+        "client_method": "get_daily_activity",
+        "csv_file": "daily_data.csv",
+        "sql_file": "activity_inserts.sql",
+        "table": "oura_activity",
+        "conflict_key": ("day",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("score", "score", "int", "nullable"),
+            ("active_calories", "active_calories", "int", "nullable"),
+            ("steps", "steps", "int", "nullable"),
+            ("calories_out", ("total_calories", "calories_out", "calories"), "int", "nullable"),
+        ],
+    },
+    "readiness": {
+        "label": "readiness",
+        "client_method": "get_daily_readiness",
+        "csv_file": "daily_readiness.csv",
+        "sql_file": "readiness_inserts.sql",
+        "table": "oura_readiness",
+        "conflict_key": ("day",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("score", "score", "int", "nullable"),
+            ("contributors", "contributors", "json", "nullable"),
+        ],
+    },
+    "sleep_time": {
+        "label": "sleep time",
+        "client_method": "get_sleep_time",
+        "csv_file": "sleep_time_data.csv",
+        "sql_file": "sleep_time_inserts.sql",
+        "table": "oura_sleep_time",
+        "conflict_key": ("day",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("optimal_bedtime", "optimal_bedtime", "json", "nullable"),
+            ("recommendation", "recommendation", "text", "nullable"),
+            ("status", "status", "text", "nullable"),
+        ],
+    },
+    "sleep_periods": {
+        "label": "sleep period",
+        "client_method": "get_sleep_periods",
+        "csv_file": "sleep_periods_data.csv",
+        "sql_file": "sleep_periods_inserts.sql",
+        "table": "oura_sleep_periods",
+        "conflict_key": ("original_id",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "required"),
+            ("day", "day", "date", "required"),
+            ("bedtime_start", "bedtime_start", "timestamp", "required"),
+            ("bedtime_end", "bedtime_end", "timestamp", "required"),
+            ("duration", ("time_in_bed", "duration"), "int", "nullable"),
+            ("type", "type", "text", "optional"),
+        ],
+    },
+    "spo2": {
+        "label": "blood oxygen",
+        "client_method": "get_daily_spo2",
+        "csv_file": "blood_oxygen_data.csv",
+        "sql_file": "spo2_inserts.sql",
+        "table": "oura_spo2",
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("spo2_percentage", ("spo2_percentage", "spo2", "avg_spo2", "average_spo2"), "json", "nullable"),
+            ("breathing_disturbance_index", ("breathing_disturbance_index", "bdi", "breathing_index"), "float", "nullable"),
+        ],
+    },
+    "stress": {
+        "label": "stress",
+        "client_method": "get_daily_stress",
+        "csv_file": "stress_data.csv",
+        "sql_file": "stress_inserts.sql",
+        "table": "oura_stress",
+        "conflict_key": ("day",),
+        "sync_interval": DAILY,
+        "sync_lookback_days": 2,
+        "sync_key": "original_id",
+        "columns": [
+            ("original_id", "id", "text", "nullable"),
+            ("day", "day", "date", "required"),
+            ("stress_high", "stress_high", "int", "nullable"),
+            ("recovery_high", "recovery_high", "int", "nullable"),
+            ("day_summary", "day_summary", "text", "nullable"),
+        ],
+    },
+}
+
+# Tables computed from other data types (see interval_join.py) rather than fetched.
+# Same keys as DATA_TYPES entries, minus the fetch/sync ones; every column is produced
+# by the join, so the CSV column is always the table column.
+DERIVED_TABLES = {
+    "sleep_hr_stats": {
+        "label": "sleep heart rate stats",
+        "csv_file": "sleep_hr_stats.csv",
+        "sql_file": "sleep_hr_stats_inserts.sql",
+        "table": "oura_sleep_hr_stats",
+        "conflict_key": ("sleep_period_id",),
+        "columns": [
+            ("sleep_period_id", "sleep_period_id", "text", "required"),
+            ("day", "day", "date", "required"),
+            ("bedtime_start", "bedtime_start", "timestamp", "required"),
+            ("bedtime_end", "bedtime_end", "timestamp", "required"),
+            ("samples", "samples", "int", "required"),
+            ("bpm_min", "bpm_min", "int", "nullable"),
+            ("bpm_avg", "bpm_avg", "float", "nullable"),
+            ("bpm_max", "bpm_max", "int", "nullable"),
+        ],
+    },
+    "activity_hr_stats": {
+        "label": "activity heart rate stats",
+        "csv_file": "activity_hr_stats.csv",
+        "sql_file": "activity_hr_stats_inserts.sql",
+        "table": "oura_activity_hr_stats",
+        "conflict_key": ("day", "activity_class"),
+        "columns": [
+            ("day", "day", "date", "required"),
+            ("activity_class", "activity_class", "text", "required"),
+            ("samples", "samples", "int", "required"),
+            ("bpm_min", "bpm_min", "int", "nullable"),
+            ("bpm_avg", "bpm_avg", "float", "nullable"),
+            ("bpm_max", "bpm_max", "int", "nullable"),
+        ],
+    },
+}
+
+# Default parameter names for the daily summary endpoints
+DEFAULT_DATE_PARAMS = ("start_date", "end_date")
+
+# Where prepare writes SQL files and load reads them from
+SQL_OUTPUT_DIR = "sql_inserts"
+
+# Rejected rows from validation are written here, one CSV per data type
+QUARANTINE_DIR = "quarantine"
+
+# Run after all inserts to convert text columns to JSONB
+JSONB_UPDATES_FILE = "jsonb_updates.sql"
+
+
+def get_data_type(name):
+    """Return the registry entry for a data type, or raise ValueError if unknown."""
+    if name not in DATA_TYPES:
+        raise ValueError(f"Unknown data type: {name} (choose from {', '.join(DATA_TYPES)})")
+    return DATA_TYPES[name]
+
+
+def select_data_types(names=None):
+    """
+    Return a list of (name, entry) pairs in registry order.
+    If names is empty or None, every data type is returned.
+    """
+    if not names:
+        return list(DATA_TYPES.items())
+    for name in names:
+        get_data_type(name)
+    return [(name, entry) for name, entry in DATA_TYPES.items() if name in names]
+
+
+def quarantine_path(name, pulled_at=None):
+    """
+    Path of the quarantine (rejected rows) file for a data type.
+    The sync daemon passes the time of each pull, so every pull gets its own file.
+    """
+    if pulled_at is None:
+        return f"{QUARANTINE_DIR}/{name}_rejects.csv"
+    return f"{QUARANTINE_DIR}/{name}_rejects_{pulled_at:%Y%m%dT%H%M%S}.csv"
+
+
+def sql_path(entry):
+    """Path of the generated SQL insert file for a registry entry."""
+    return f"{SQL_OUTPUT_DIR}/{entry['sql_file']}"
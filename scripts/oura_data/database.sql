@@ -154,9 +154,9 @@ CREATE TABLE oura_sleep_time (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     original_id VARCHAR(255),
     day DATE NOT NULL,
-    bedtime_start TIMESTAMPTZ,
-    bedtime_end TIMESTAMPTZ,
-    duration INTEGER,       -- duration in seconds
+    optimal_bedtime JSONB,  -- day_tz, start_offset, end_offset (seconds from midnight)
+    recommendation VARCHAR(50),
+    status VARCHAR(50),
     contributors JSONB,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -168,6 +168,34 @@ CREATE INDEX idx_oura_sleep_time_day ON oura_sleep_time(day);
 
 COMMENT ON TABLE oura_sleep_time IS 'Stores sleep timing data from Oura Ring';
 
+-- Databases created with the earlier bedtime_start/bedtime_end/duration columns
+-- (the sleep time endpoint never returned them) can be updated with:
+-- ALTER TABLE oura_sleep_time
+--     DROP COLUMN bedtime_start, DROP COLUMN bedtime_end, DROP COLUMN duration,
+--     ADD COLUMN optimal_bedtime JSONB, ADD COLUMN recommendation VARCHAR(50), ADD COLUMN status VARCHAR(50);
+
+-- - oura_sleep_periods (each sleep or nap, with its start and end time)
+CREATE TABLE oura_sleep_periods (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    original_id VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    bedtime_start TIMESTAMPTZ NOT NULL,
+    bedtime_end TIMESTAMPTZ NOT NULL,
+    duration INTEGER,       -- time in bed in seconds
+    type VARCHAR(50),       -- long_sleep, sleep, late_nap, rest
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE(original_id)
+    
+    -- Note: No UNIQUE constraint on day because naps give several periods per day
+);
+
+-- Add indices for common queries
+CREATE INDEX idx_oura_sleep_periods_day ON oura_sleep_periods(day);
+CREATE INDEX idx_oura_sleep_periods_bedtime_start ON oura_sleep_periods(bedtime_start);
+
+COMMENT ON TABLE oura_sleep_periods IS 'Stores sleep periods (start and end times) from Oura Ring';
+
 -- - oura_spo2 (blood oxygen)
 CREATE TABLE oura_spo2 (
     -- Primary key
@@ -215,6 +243,45 @@ CREATE INDEX idx_oura_stress_day_summary ON oura_stress(day_summary);
 
 COMMENT ON TABLE oura_stress IS 'Stores daily stress data from Oura Ring';
 
+-- - oura_sleep_hr_stats and oura_activity_hr_stats
+-- Precomputed by interval_join.py (python oura.py join), so the sleep heart rate and
+-- exertion charts don't need a range join over oura_heart_rate at query time
+CREATE TABLE oura_sleep_hr_stats (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    sleep_period_id VARCHAR(255) NOT NULL,  -- original_id of the oura_sleep_periods row
+    day DATE NOT NULL,
+    bedtime_start TIMESTAMPTZ NOT NULL,
+    bedtime_end TIMESTAMPTZ NOT NULL,
+    samples INTEGER NOT NULL,       -- heart rate samples inside the sleep period
+    bpm_min INTEGER,
+    bpm_avg FLOAT,
+    bpm_max INTEGER,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE(sleep_period_id)
+);
+
+CREATE INDEX idx_oura_sleep_hr_stats_day ON oura_sleep_hr_stats(day);
+
+COMMENT ON TABLE oura_sleep_hr_stats IS 'Heart rate statistics for each Oura sleep period';
+
+CREATE TABLE oura_activity_hr_stats (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    day DATE NOT NULL,
+    activity_class VARCHAR(20) NOT NULL,  -- non_wear, rest, inactive, low, medium, high
+    samples INTEGER NOT NULL,             -- heart rate samples in 5-minute slots of this class
+    bpm_min INTEGER,
+    bpm_avg FLOAT,
+    bpm_max INTEGER,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE(day, activity_class)
+);
+
+CREATE INDEX idx_oura_activity_hr_stats_day ON oura_activity_hr_stats(day);
+
+COMMENT ON TABLE oura_activity_hr_stats IS 'Heart rate statistics per day and Oura 5-minute activity class';
+
 -- Add JSONB indices for all tables that use JSONB
 CREATE INDEX idx_sleep_contributors ON oura_sleep USING GIN (contributors);
 CREATE INDEX idx_activity_contributors ON oura_activity USING GIN (contributors);
@@ -315,7 +382,7 @@ WITH (FORMAT CSV, HEADER true);
 UPDATE public.oura_readiness
 SET contributors = contributors::jsonb;
 
-COPY public.oura_sleep_time(original_id, day, bedtime_start, bedtime_end, duration)
+COPY public.oura_sleep_time(original_id, day, optimal_bedtime, recommendation, status)
 FROM 'sleep_time_data.csv'
 WITH (FORMAT CSV, HEADER true);
 
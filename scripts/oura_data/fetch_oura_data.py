@@ -19,16 +19,22 @@
 # TODO: Set up environment variables
 # Hint: Use python-dotenv to load your OURA_API_KEY from a .env file
 
-from dotenv import load_dotenv
 import os
-import requests
-import pandas as pd
-from oura_ring import OuraClient
 from datetime import datetime, timedelta
 
-load_dotenv()
+from data_types import DEFAULT_DATE_PARAMS, get_data_type, select_data_types
 
-OURA_API_KEY = os.getenv("OURA_API_KEY")
+# Heavy dependencies (python-dotenv, oura_ring, pandas) are imported inside the
+# functions that use them, so importing this module (e.g. from oura.py) is cheap.
+
+
+def get_oura_client():
+    """Load OURA_API_KEY from .env and create an Oura client."""
+    from dotenv import load_dotenv
+    from oura_ring import OuraClient
+
+    load_dotenv()
+    return OuraClient(os.getenv("OURA_API_KEY"))
 
 
 # TODO: Create a function to fetch data from the Oura API
@@ -43,44 +49,41 @@ OURA_API_KEY = os.getenv("OURA_API_KEY")
 # Note: You can either use the requests library and construct API calls directly,
 # or use the oura-ring package which simplifies the process.
 # Documentation: https://pypi.org/project/oura-ring/
-def fetch_oura_data(data_type, start_date, end_date):
-    # Create Oura client
-    client = OuraClient(OURA_API_KEY)
+def fetch_oura_data(data_type, start_date, end_date, client=None):
+    # Create Oura client (callers fetching several types can pass one in)
+    if client is None:
+        client = get_oura_client()
+    
+    try:
+        entry = get_data_type(data_type)
+    except ValueError as e:
+        print(e)
+        return None
+    
+    method = getattr(client, entry["client_method"])
+    start_param, end_param = entry.get("date_params", DEFAULT_DATE_PARAMS)
     
     try:
         print(f"  Making API call for {data_type}...")
-        if data_type == "sleep":
-            return client.get_daily_sleep(start_date=start_date, end_date=end_date)
-        elif data_type == "heart_rate":
+        if not entry.get("retry_without_dates"):
+            return method(**{start_param: start_date, end_param: end_date})
+        
+        try:
+            # Try different parameter combinations
+            print(f"  Trying with {start_param}/{end_param}...")
+            result = method(**{start_param: start_date, end_param: end_date})
+            print("  Success!")
+            return result
+        except Exception as e1:
+            print(f"  Failed with {start_param}/{end_param}: {e1}")
             try:
-                # Try different parameter combinations
-                print("  Trying with start_datetime/end_datetime...")
-                result = client.get_heart_rate(start_datetime=start_date, end_datetime=end_date)
-                print("  Success!")
+                print("  Trying with no parameters (default behavior)...")
+                result = method()
+                print("  Success with no parameters!")
                 return result
-            except Exception as e1:
-                print(f"  Failed with start_datetime/end_datetime: {e1}")
-                try:
-                    print("  Trying with no parameters (default behavior)...")
-                    result = client.get_heart_rate()
-                    print("  Success with no parameters!")
-                    return result
-                except Exception as e2:
-                    print(f"  Failed with no parameters: {e2}")
-                    raise ValueError(f"Could not get heart rate data with any parameter combination: {e1}, {e2}")
-        elif data_type == "activity":
-            return client.get_daily_activity(start_date=start_date, end_date=end_date)
-        elif data_type == "readiness":
-            return client.get_daily_readiness(start_date=start_date, end_date=end_date)
-        elif data_type == "sleep_time":
-            return client.get_sleep_time(start_date=start_date, end_date=end_date)
-        elif data_type == "spo2":
-            return client.get_daily_spo2(start_date=start_date, end_date=end_date)
-        elif data_type == "stress":
-            return client.get_daily_stress(start_date=start_date, end_date=end_date)
-        else:
-            print(f"Unknown data type: {data_type}")
-            return None
+            except Exception as e2:
+                print(f"  Failed with no parameters: {e2}")
+                raise ValueError(f"Could not get {entry['label']} data with any parameter combination: {e1}, {e2}")
     except Exception as e:
         import traceback
         print(f"Error fetching {data_type} data: {e}")
@@ -102,6 +105,8 @@ def convert_to_csv(list_data, string_filename):
         print("Error no data")
         return False
     
+    import pandas as pd
+    
     df = pd.DataFrame(list_data)
     df.to_csv(string_filename) 
     return True
@@ -115,58 +120,49 @@ def convert_to_csv(list_data, string_filename):
 #   4. (Bonus) Implement error handling
 #   5. (Bonus) Add command-line arguments for date range, data types, etc.
 
+def fetch_all(data_types=None, days=30, start_date=None, end_date=None):
+    """
+    Fetch the given data types (all registered types by default) and save each to its CSV file.
+    Returns a tuple of (saved_types, total_types).
+    """
+    # Calculate date range (last `days` days unless given explicitly)
+    if end_date is None:
+        end_date = datetime.now().strftime('%Y-%m-%d')
+    if start_date is None:
+        start_date = (datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=days)).strftime('%Y-%m-%d')
+    
+    print(f"Fetching Oura data from {start_date} to {end_date}...")
+    
+    # One client for every data type
+    client = get_oura_client()
+    
+    # Fetch different types of data with detailed logging
+    results = []
+    for name, entry in select_data_types(data_types):
+        print(f"Fetching {entry['label']} data...")
+        data = fetch_oura_data(name, start_date, end_date, client=client)
+        print(f"Got {entry['label']} data: {len(data) if data else 0} records")
+        results.append((entry, data))
+    
+    # Convert each dataset to CSV
+    print("Converting data to CSV files...")
+    saved = 0
+    for entry, data in results:
+        if convert_to_csv(data, entry["csv_file"]):
+            saved += 1
+    
+    print(f"All done! Saved {saved}/{len(results)} data types.")
+    if saved < len(results):
+        print("Some data types could not be fetched. Please check the errors above.")
+    return saved, len(results)
+
+
 def main():
     try:
-        # Calculate date range (last 30 days)
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        
-        print(f"Fetching Oura data from {start_date} to {end_date}...")
-        
-        # Fetch different types of data with detailed logging
-        print("Fetching sleep data...")
-        sleep_data = fetch_oura_data("sleep", start_date, end_date)
-        print(f"Got sleep data: {len(sleep_data) if sleep_data else 0} records")
-        
-        print("Fetching heart rate data...")
-        heart_rate_data = fetch_oura_data("heart_rate", start_date, end_date)
-        print(f"Got heart rate data: {len(heart_rate_data) if heart_rate_data else 0} records")
-        
-        print("Fetching activity data...")
-        daily_data = fetch_oura_data("activity", start_date, end_date)
-        print(f"Got activity data: {len(daily_data) if daily_data else 0} records")
-        
-        print("Fetching readiness data...")
-        daily_readiness = fetch_oura_data("readiness", start_date, end_date)
-        print(f"Got readiness data: {len(daily_readiness) if daily_readiness else 0} records")
-        
-        print("Fetching sleep time data...")
-        sleep_time_data = fetch_oura_data("sleep_time", start_date, end_date)
-        print(f"Got sleep time data: {len(sleep_time_data) if sleep_time_data else 0} records")
-        
-        print("Fetching blood oxygen data...")
-        blood_oxygen_data = fetch_oura_data("spo2", start_date, end_date)
-        print(f"Got blood oxygen data: {len(blood_oxygen_data) if blood_oxygen_data else 0} records")
-        
-        print("Fetching stress data...")
-        stress_data = fetch_oura_data("stress", start_date, end_date)
-        print(f"Got stress data: {len(stress_data) if stress_data else 0} records")
-        
-        # Convert each dataset to CSV
-        print("Converting data to CSV files...")
-        convert_to_csv(sleep_data, "sleep_data.csv")
-        convert_to_csv(heart_rate_data, "heart_rate_data.csv")
-        convert_to_csv(daily_data, "daily_data.csv")
-        convert_to_csv(daily_readiness, "daily_readiness.csv")
-        convert_to_csv(sleep_time_data, "sleep_time_data.csv")
-        convert_to_csv(blood_oxygen_data, "blood_oxygen_data.csv")
-        convert_to_csv(stress_data, "stress_data.csv")
-        
-        print("All done!")
+        fetch_all()
     except Exception as e:
         import traceback
         print(f"Error in main function: {e}")
         print(f"Error details: {traceback.format_exc()}")
 
 if __name__ == "__main__": main()
-
@@ -0,0 +1,215 @@
+# -------------------------------------------------------
+#  Heart Rate Interval Join
+# -------------------------------------------------------
+#   Labels every heart rate sample with:
+#     - the sleep period it falls in (sleep_periods_data.csv)
+#     - the 5-minute activity class it falls in
+#       (class_5_min in daily_data.csv)
+#   and writes per-window heart rate statistics for the
+#   oura_sleep_hr_stats and oura_activity_hr_stats tables.
+#
+#   Windows are kept as sorted arrays of start times, so each
+#   sample is placed with a binary search over the starts
+#   (np.searchsorted) instead of a range join in SQL.
+# -------------------------------------------------------
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_types import DERIVED_TABLES, SQL_OUTPUT_DIR, get_data_type, sql_path
+from prepare_data import build_insert_statements
+from validate_data import SchemaDriftError, read_text_csv, validate_csv
+
+# Meaning of each digit in class_5_min (from the Oura API docs)
+ACTIVITY_CLASSES = ["non_wear", "rest", "inactive", "low", "medium", "high"]
+
+SLOT_NANOSECONDS = 5 * 60 * 1_000_000_000
+
+# Data types whose CSV files the join reads
+JOIN_INPUTS = ("heart_rate", "sleep_periods", "activity")
+
+
+def to_nanoseconds(timestamps):
+    """Convert timestamp strings (any UTC offset) to int64 nanoseconds since the epoch."""
+    return pd.to_datetime(timestamps, utc=True, format="ISO8601").to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def overlapping_windows(starts, ends):
+    """Mask of windows (sorted by start) that start before an earlier window has ended."""
+    overlaps = np.zeros(len(starts), dtype=bool)
+    if len(starts) > 1:
+        overlaps[1:] = starts[1:] < np.maximum.accumulate(ends)[:-1]
+    return overlaps
+
+
+def find_windows(times, starts, ends):
+    """
+    For each time, return the index of the window [starts[i], ends[i]) containing it, or -1.
+    starts must be sorted and windows must not overlap (raises ValueError if they do).
+    times does not need to be sorted.
+    """
+    if overlapping_windows(starts, ends).any():
+        raise ValueError("windows overlap")
+    index = np.searchsorted(starts, times, side="right") - 1
+    inside = index >= 0
+    inside[inside] = times[inside] < ends[index[inside]]
+    return np.where(inside, index, -1)
+
+
+def load_heart_rate(csv_file=None):
+    """Validated heart rate samples with a ns column."""
+    samples, _ = validate_csv("heart_rate", csv_file)
+    return samples.assign(ns=to_nanoseconds(samples["timestamp"]), bpm=samples["bpm"].astype(np.int64))
+
+
+def load_sleep_windows(csv_file=None):
+    """
+    Validated sleep periods with start_ns/end_ns columns, sorted by start.
+    A period that starts before an earlier one has ended is dropped (with a warning),
+    since a heart rate sample can only be counted in one period.
+    """
+    periods, _ = validate_csv("sleep_periods", csv_file)
+    periods = periods.assign(
+        start_ns=to_nanoseconds(periods["bedtime_start"]),
+        end_ns=to_nanoseconds(periods["bedtime_end"]),
+    )
+    periods = periods.sort_values("start_ns", kind="stable").reset_index(drop=True)
+
+    overlaps = overlapping_windows(periods["start_ns"].to_numpy(), periods["end_ns"].to_numpy())
+    if overlaps.any():
+        print(f"  WARNING: skipping {int(overlaps.sum())} sleep periods that overlap an earlier one: "
+              f"{', '.join(periods.loc[overlaps, 'original_id'])}")
+    return periods[~overlaps].reset_index(drop=True)
+
+
+def load_activity_slots(csv_file=None):
+    """
+    Expand class_5_min from the daily activity CSV into one row per 5-minute slot.
+    Returns (slot start ns, activity class digit, index into days, days) with slots sorted by start.
+    """
+    entry = get_data_type("activity")
+    daily = read_text_csv(csv_file or entry["csv_file"])
+    missing = [c for c in ("day", "timestamp", "class_5_min") if c not in daily.columns]
+    if missing:
+        raise SchemaDriftError(f"{csv_file or entry['csv_file']} is missing {', '.join(missing)}")
+
+    daily = daily[(daily["class_5_min"] != "") & (daily["timestamp"] != "")].reset_index(drop=True)
+    day_starts = to_nanoseconds(daily["timestamp"])
+    lengths = daily["class_5_min"].str.len().to_numpy()
+
+    # One entry per slot: class digit, which day it belongs to, and its start time
+    classes = np.frombuffer("".join(daily["class_5_min"]).encode("ascii"), dtype=np.uint8).astype(np.int16) - ord("0")
+    day_index = np.repeat(np.arange(len(daily)), lengths)
+    slot_in_day = np.arange(len(classes)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    slot_starts = day_starts[day_index] + slot_in_day * SLOT_NANOSECONDS
+
+    order = np.argsort(slot_starts, kind="stable")
+    slot_starts, classes, day_index = slot_starts[order], classes[order], day_index[order]
+
+    # Days can overlap around a DST change; the slots of the earlier day are kept
+    keep = ~overlapping_windows(slot_starts, slot_starts + SLOT_NANOSECONDS)
+    return slot_starts[keep], classes[keep], day_index[keep], daily["day"].to_numpy()
+
+
+def label_heart_rate(samples, windows, slot_starts, slot_classes, slot_days, days):
+    """Add sleep_period (index into windows, -1 if awake), activity_class and activity_day columns to samples."""
+    times = samples["ns"].to_numpy()
+
+    sleep_index = find_windows(times, windows["start_ns"].to_numpy(), windows["end_ns"].to_numpy())
+
+    slot_index = find_windows(times, slot_starts, slot_starts + SLOT_NANOSECONDS)
+    has_slot = slot_index >= 0
+    class_digits = np.where(has_slot, slot_classes[np.maximum(slot_index, 0)], -1)
+    class_names = np.array(ACTIVITY_CLASSES + [None], dtype=object)
+
+    return samples.assign(
+        sleep_period=sleep_index,
+        activity_class=class_names[np.where((class_digits >= 0) & (class_digits < len(ACTIVITY_CLASSES)), class_digits, -1)],
+        activity_day=np.where(has_slot, days[slot_days[np.maximum(slot_index, 0)]], None),
+    )
+
+
+def bpm_stats(groups):
+    """samples/bpm_min/bpm_avg/bpm_max for a grouped bpm column."""
+    stats = groups["bpm"].agg(samples="count", bpm_min="min", bpm_avg="mean", bpm_max="max")
+    stats["bpm_avg"] = stats["bpm_avg"].round(1)
+    return stats
+
+
+def sleep_hr_stats(labeled, windows):
+    """One row per sleep period, with the heart rate statistics of the samples inside it."""
+    stats = bpm_stats(labeled[labeled["sleep_period"] >= 0].groupby("sleep_period"))
+    stats = windows.join(stats, how="left")
+    stats["samples"] = stats["samples"].fillna(0).astype("Int64")
+    for column in ("bpm_min", "bpm_max"):
+        stats[column] = stats[column].astype("Int64")
+    return pd.DataFrame({
+        "sleep_period_id": stats["original_id"],
+        "day": stats["day"],
+        "bedtime_start": stats["bedtime_start"],
+        "bedtime_end": stats["bedtime_end"],
+        "samples": stats["samples"],
+        "bpm_min": stats["bpm_min"],
+        "bpm_avg": stats["bpm_avg"],
+        "bpm_max": stats["bpm_max"],
+    })
+
+
+def activity_hr_stats(labeled):
+    """One row per day and activity class that has heart rate samples."""
+    awake = labeled[labeled["activity_class"].notna()]
+    stats = bpm_stats(awake.groupby(["activity_day", "activity_class"])).reset_index()
+    for column in ("samples", "bpm_min", "bpm_max"):
+        stats[column] = stats[column].astype("Int64")
+    return stats.rename(columns={"activity_day": "day"})[[c for c, _, _, _ in DERIVED_TABLES["activity_hr_stats"]["columns"]]]
+
+
+def write_derived(name, stats):
+    """Write a derived table as CSV and as SQL inserts (picked up by 'python oura.py load')."""
+    entry = DERIVED_TABLES[name]
+    stats.to_csv(entry["csv_file"], index=False)
+
+    os.makedirs(SQL_OUTPUT_DIR, exist_ok=True)
+    with open(sql_path(entry), 'w') as f_out:
+        f_out.writelines(build_insert_statements(entry, stats))
+    print(f"{entry['label'].capitalize()}: {len(stats)} rows written to {entry['csv_file']} and {sql_path(entry)}")
+
+
+def run_join(labeled_csv=None):
+    """
+    Join heart rate samples to sleep periods and activity classes and write the
+    per-window statistics. If labeled_csv is given, the labeled samples are written there too.
+    Returns the labeled samples, or None if an input CSV is missing or doesn't match its table.
+    """
+    missing = [name for name in JOIN_INPUTS if not os.path.exists(get_data_type(name)["csv_file"])]
+    for name in missing:
+        print(f"ERROR: {get_data_type(name)['csv_file']} not found in current directory.")
+        print(f"Run 'python oura.py fetch --types {name}' to fetch it.")
+    if missing:
+        return None
+
+    print("Loading heart rate samples, sleep periods and activity classes...")
+    try:
+        samples = load_heart_rate()
+        windows = load_sleep_windows()
+        slot_starts, slot_classes, slot_days, days = load_activity_slots()
+    except SchemaDriftError as e:
+        print(f"ERROR: schema drift: {e}")
+        return None
+    print(f"  {len(samples)} heart rate samples, {len(windows)} sleep periods, {len(slot_starts)} activity slots")
+
+    labeled = label_heart_rate(samples, windows, slot_starts, slot_classes, slot_days, days)
+    asleep = int((labeled["sleep_period"] >= 0).sum())
+    print(f"  {asleep} samples during sleep, {int(labeled['activity_class'].notna().sum())} with an activity class")
+
+    if labeled_csv:
+        out = labeled.drop(columns=["ns"])
+        out["sleep_period_id"] = windows["original_id"].reindex(out["sleep_period"]).to_numpy()
+        out.drop(columns=["sleep_period"]).to_csv(labeled_csv, index=False)
+        print(f"Labeled heart rate samples written to {labeled_csv}")
+
+    write_derived("sleep_hr_stats", sleep_hr_stats(labeled, windows))
+    write_derived("activity_hr_stats", activity_hr_stats(labeled))
+    return labeled
@@ -0,0 +1,94 @@
+# -------------------------------------------------------
+#  Load generated SQL into Supabase
+# -------------------------------------------------------
+#   Runs the files produced by prepare_data.py (sql_inserts/*.sql)
+#   against the Supabase Postgres database, then runs
+#   jsonb_updates.sql to convert text columns to JSONB.
+#   SQL files from interval_join.py are loaded too, if present.
+#
+#   The connection string is read from DATABASE_URL
+#   (Supabase: Project Settings -> Database -> Connection string).
+# -------------------------------------------------------
+
+import os
+
+from data_types import DERIVED_TABLES, JSONB_UPDATES_FILE, SQL_OUTPUT_DIR, select_data_types, sql_path
+
+
+def get_connection(database_url=None):
+    """Open a Postgres connection using database_url or DATABASE_URL from .env."""
+    # Only the load subcommand needs a database driver
+    import psycopg2
+
+    if database_url is None:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL is not set (add it to your .env or pass --database-url)")
+    return psycopg2.connect(database_url)
+
+
+def run_sql_file(conn, sql_file):
+    """Execute every statement in sql_file inside one transaction."""
+    with open(sql_file, 'r') as f:
+        sql = f.read()
+
+    if not sql.strip():
+        print(f"  {sql_file} is empty, skipping")
+        return False
+
+    with conn.cursor() as cur:
+        cur.execute(sql)
+    conn.commit()
+    print(f"  Loaded {sql_file}")
+    return True
+
+
+def load_all(data_types=None, database_url=None):
+    """
+    Load the SQL insert files for the given data types (all registered types by default).
+    Returns the number of files that were loaded successfully.
+    """
+    conn = get_connection(database_url)
+    loaded = 0
+    try:
+        for name, entry in select_data_types(data_types):
+            sql_file = sql_path(entry)
+            if not os.path.exists(sql_file):
+                print(f"ERROR: {sql_file} not found. Run 'python oura.py prepare' first.")
+                continue
+
+            try:
+                if run_sql_file(conn, sql_file):
+                    loaded += 1
+            except Exception as e:
+                conn.rollback()
+                print(f"ERROR loading {sql_file} into {entry['table']}: {e}")
+
+        # Tables precomputed by 'python oura.py join', if it has been run
+        for name, entry in DERIVED_TABLES.items():
+            sql_file = sql_path(entry)
+            if not os.path.exists(sql_file):
+                continue
+
+            try:
+                if run_sql_file(conn, sql_file):
+                    loaded += 1
+            except Exception as e:
+                conn.rollback()
+                print(f"ERROR loading {sql_file} into {entry['table']}: {e}")
+
+        jsonb_file = f"{SQL_OUTPUT_DIR}/{JSONB_UPDATES_FILE}"
+        if os.path.exists(jsonb_file):
+            try:
+                run_sql_file(conn, jsonb_file)
+            except Exception as e:
+                conn.rollback()
+                print(f"ERROR running {jsonb_file}: {e}")
+    finally:
+        conn.close()
+
+    print(f"Loaded {loaded} SQL files into the database.")
+    return loaded
@@ -0,0 +1,111 @@
+# -------------------------------------------------------
+#  Oura Data Command Line
+# -------------------------------------------------------
+#   One entry point for the whole Oura pipeline:
+#     python oura.py fetch     -> Oura API to CSV files
+#     python oura.py prepare   -> CSV files to SQL insert files
+#     python oura.py load      -> SQL insert files to Supabase
+#     python oura.py join      -> heart rate stats per sleep period
+#                                 and activity class (interval_join.py)
+#     python oura.py serve     -> keep running and sync new data
+#                                 on a schedule (see sync_daemon.py)
+#
+#   Every subcommand takes --types to limit which data types
+#   (see data_types.py) it works on. Each subcommand imports
+#   its own module only when it runs: load never imports pandas
+#   or oura_ring, and prepare only imports pandas once it starts
+#   validating CSVs (downloads don't need it).
+# -------------------------------------------------------
+
+import argparse
+import sys
+
+from data_types import DATA_TYPES
+
+
+def run_fetch(args):
+    from fetch_oura_data import fetch_all
+
+    saved_types, total_types = fetch_all(args.types, days=args.days, start_date=args.start_date, end_date=args.end_date)
+    # Exit non-zero on any failed type so cron notices partial failures
+    return 0 if saved_types == total_types else 1
+
+
+def run_prepare(args):
+    from prepare_data import download_csvs, prepare_all
+
+    # Download any CSV URLs first, then process everything in the same run
+    downloaded = download_csvs(args.sources, max_workers=args.workers)
+
+    successful_files, total_files = prepare_all(args.types)
+    # A failed download means prepare may have used an older CSV
+    return 0 if successful_files == total_files and None not in downloaded else 1
+
+
+def run_load(args):
+    from load_data import load_all
+
+    loaded = load_all(args.types, database_url=args.database_url)
+    return 0 if loaded else 1
+
+
+def run_join(args):
+    from interval_join import run_join as join
+
+    labeled = join(labeled_csv=args.labeled_csv)
+    return 0 if labeled is not None else 1
+
+
+def run_serve(args):
+    from sync_daemon import SyncDaemon
+
+    SyncDaemon(args.types, database_url=args.database_url, sql_only=args.sql_only).run(port=args.port)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Fetch, prepare and load Oura Ring data for Hygieia.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Shared --types option for every subcommand
+    types_parser = argparse.ArgumentParser(add_help=False)
+    types_parser.add_argument(
+        "--types", nargs="+", choices=list(DATA_TYPES), metavar="TYPE",
+        help=f"Data types to process (default: all). Choices: {', '.join(DATA_TYPES)}",
+    )
+
+    fetch_parser = subparsers.add_parser("fetch", parents=[types_parser], help="Fetch data from the Oura API into CSV files")
+    fetch_parser.add_argument("--days", type=int, default=30, help="Number of days to fetch (default: 30)")
+    fetch_parser.add_argument("--start-date", help="Start date in YYYY-MM-DD format (overrides --days)")
+    fetch_parser.add_argument("--end-date", help="End date in YYYY-MM-DD format (default: today)")
+    fetch_parser.set_defaults(func=run_fetch)
+
+    prepare_parser = subparsers.add_parser("prepare", parents=[types_parser], help="Generate SQL insert files from CSV files")
+    prepare_parser.add_argument("sources", nargs="*", metavar="[TYPE=]URL", help="CSV URLs to download before preparing; TYPE=URL saves it as that type's CSV (append #sha256=<hex> to verify)")
+    prepare_parser.add_argument("--workers", type=int, default=4, help="Number of concurrent downloads (default: 4)")
+    prepare_parser.set_defaults(func=run_prepare)
+
+    load_parser = subparsers.add_parser("load", parents=[types_parser], help="Run generated SQL files against Supabase")
+    load_parser.add_argument("--database-url", help="Postgres connection string (default: DATABASE_URL from .env)")
+    load_parser.set_defaults(func=run_load)
+
+    join_parser = subparsers.add_parser("join", help="Compute heart rate stats per sleep period and activity class")
+    join_parser.add_argument("--labeled-csv", metavar="FILE", help="Also write every heart rate sample with its sleep period and activity class")
+    join_parser.set_defaults(func=run_join)
+
+    serve_parser = subparsers.add_parser("serve", parents=[types_parser], help="Keep running and push new data to Supabase on a schedule")
+    serve_parser.add_argument("--database-url", help="Postgres connection string (default: DATABASE_URL from .env)")
+    serve_parser.add_argument("--sql-only", action="store_true", help="Append new rows to the sql_inserts/ files instead of loading them")
+    serve_parser.add_argument("--port", type=int, default=8787, help="Port for the local metrics endpoint (default: 8787)")
+    serve_parser.set_defaults(func=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
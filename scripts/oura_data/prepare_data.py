@@ -1,502 +1,251 @@
-import csv
-import json
+import hashlib
 import os
-import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-def generate_inserts_for_sleep_data(csv_file, output_file):
-    """Generate SQL inserts for oura_sleep table from CSV file"""
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('{}', '{}', {}, '{}', '{}');
+from data_types import DATA_TYPES, JSONB_UPDATES_FILE, SQL_OUTPUT_DIR, get_data_type, select_data_types, sql_path
+
+# SQL insert statement template, filled in with the table, column list, values and ON CONFLICT clause
+INSERT_TEMPLATE = """
+    INSERT INTO public.{} ({})
+    VALUES ({})
+    {};
     """
-    
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        next(reader)  # Skip header row
-        
-        for row in reader:
-            # Skip empty rows
-            if len(row) < 5:
-                continue
-                
-            # Extract data (skipping the first index column)
-            _, original_id, contributors, day, score, timestamp = row
-            
-            # Clean up the contributors JSON string - replace single quotes with double quotes
-            contributors = contributors.replace("'", '"')
-            
-            # Format the SQL insert statement
-            sql = insert_template.format(
-                original_id,
-                day,
-                score,
-                contributors,
-                timestamp
-            )
-            
-            # Write to output file
-            f_out.write(sql)
-    
-    print(f"Sleep data SQL insert statements generated in {output_file}")
 
-def generate_inserts_for_heart_rate(csv_file, output_file):
-    """Generate SQL inserts for oura_heart_rate table from CSV file"""
-    # First check if we have a type column in our schema
-    has_type_column = True  # Default assumption
-    
-    try:
-        # Check if we have a schema file to determine if type column exists
-        schema_file = 'database.sql'
-        if os.path.exists(schema_file):
-            with open(schema_file, 'r') as f:
-                schema_content = f.read()
-                # Look for type column in heart_rate table definition
-                if 'CREATE TABLE oura_heart_rate' in schema_content:
-                    heart_rate_schema = schema_content.split('CREATE TABLE oura_heart_rate')[1].split(';')[0]
-                    has_type_column = 'type VARCHAR' in heart_rate_schema
-                    print(f"Detected type column in schema: {has_type_column}")
-    except Exception as e:
-        print(f"Error checking schema file: {e}")
-        # Proceed with default assumption
-    
-    # SQL insert statement template - with or without type column
-    if has_type_column:
-        insert_template = """
-        INSERT INTO public.oura_heart_rate (bpm, source, timestamp, type)
-        VALUES ({}, '{}', '{}', '{}');
-        """
+def on_conflict_clause(entry, columns):
+    """
+    Upsert on the table's conflict_key (see data_types.py), so re-running a load
+    updates rows instead of failing the whole file; otherwise skip duplicates.
+    """
+    conflict_key = entry.get("conflict_key")
+    if not conflict_key:
+        return "ON CONFLICT DO NOTHING"
+    updates = [f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_key] + ["updated_at = NOW()"]
+    return f"ON CONFLICT ({', '.join(conflict_key)}) DO UPDATE SET {', '.join(updates)}"
+
+def sql_literals(values, kind):
+    """Format a coerced column as SQL literals (NULL for missing values)."""
+    if kind in ("int", "float"):
+        literals = values.astype(str)
     else:
-        insert_template = """
-        INSERT INTO public.oura_heart_rate (bpm, source, timestamp)
-        VALUES ({}, '{}', '{}');
-        """
-    
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        header = next(reader)  # Get header row
-        print(f"Heart rate CSV headers: {header}")  # Print headers to understand structure
-        
-        # Find column indices based on headers
-        bpm_col = header.index('bpm') if 'bpm' in header else 1  # Default to column 1 if not found
-        source_col = header.index('source') if 'source' in header else 2  # Default to column 2
-        timestamp_col = header.index('timestamp') if 'timestamp' in header else 3  # Default to column 3
-        type_col = header.index('type') if 'type' in header else None
-        
-        rows_processed = 0
-        for row in reader:
-            # For debugging, print the actual columns in the first row
-            if reader.line_num == 2:  # First data row
-                print(f"First heart rate row: {row}")
-            
-            # Skip empty rows
-            if len(row) < 3:
-                continue
-            
-            # Extract data using the identified column indices
-            try:
-                # Check if the column exists in the row
-                bpm = row[bpm_col] if bpm_col < len(row) else 'NULL'
-                source = row[source_col] if source_col < len(row) else ''
-                timestamp = row[timestamp_col] if timestamp_col < len(row) else ''
-                
-                # Only get type if we're using it in our schema
-                type_value = ''
-                if has_type_column and type_col is not None and type_col < len(row):
-                    type_value = row[type_col]
-                
-                # Handle empty values
-                bpm = bpm if bpm and bpm != '' else 'NULL'
-                source = source if source else ''
-                timestamp = timestamp if timestamp else ''
-                
-                # Format the SQL insert statement based on whether we have type column
-                if has_type_column:
-                    sql = insert_template.format(bpm, source, timestamp, type_value)
-                else:
-                    sql = insert_template.format(bpm, source, timestamp)
-                
-                # Write to output file
-                f_out.write(sql)
-                rows_processed += 1
-                
-                # Print progress every 1000 rows
-                if rows_processed % 1000 == 0:
-                    print(f"Processed {rows_processed} heart rate records...")
-                    
-            except Exception as e:
-                print(f"Error processing row {reader.line_num}: {e}")
-                print(f"Row data: {row}")
-                # Continue processing other rows
-    
-    print(f"Heart rate data SQL insert statements generated in {output_file}")
-    print(f"Total heart rate records processed: {rows_processed}")
+        # Quote text-like values, escaping embedded single quotes
+        literals = "'" + values.astype(str).str.replace("'", "''", regex=False) + "'"
+    return literals.where(values.notna(), "NULL")
 
-def generate_inserts_for_activity(csv_file, output_file):
-    """Generate SQL inserts for oura_activity table from CSV file"""
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('{}', '{}', {}, {}, {}, {});
-    """
+def build_insert_statements(entry, clean):
+    """Return one INSERT statement per row of a validated DataFrame (see validate_data.py)."""
+    if clean.empty:
+        return []
     
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        header = next(reader)  # Get header row
-        print(f"Activity CSV headers: {header}")  # Print headers to understand structure
-        
-        for row in reader:
-            # Skip empty rows
-            if len(row) < 5:
-                continue
-                
-            # Extract data (skipping the first index column)
-            # For debugging, print the actual columns in the first row
-            if reader.line_num == 2:  # First data row
-                print(f"First row columns: {row}")
-            
-            # Use the columns we need for our table, regardless of total columns
-            index = 0
-            original_id = row[1] if len(row) > 1 else ''
-            day = row[2] if len(row) > 2 else ''
-            score = row[3] if len(row) > 3 else 'NULL'
-            
-            # There might be different column positions in your CSV,
-            # adjust these based on the printed header
-            active_calories = 'NULL'
-            steps = 'NULL'
-            calories_out = 'NULL'
-            
-            # Find the right columns based on headers
-            if 'active_calories' in header:
-                active_calories_idx = header.index('active_calories')
-                active_calories = row[active_calories_idx] if len(row) > active_calories_idx else 'NULL'
-            
-            if 'steps' in header:
-                steps_idx = header.index('steps')
-                steps = row[steps_idx] if len(row) > steps_idx else 'NULL'
-                
-            if 'calories' in header or 'calories_out' in header:
-                calories_idx = header.index('calories' if 'calories' in header else 'calories_out')
-                calories_out = row[calories_idx] if len(row) > calories_idx else 'NULL'
-            
-            # Handle empty values
-            score = score if score and score != '' else 'NULL'
-            active_calories = active_calories if active_calories and active_calories != '' else 'NULL'
-            steps = steps if steps and steps != '' else 'NULL'
-            calories_out = calories_out if calories_out and calories_out != '' else 'NULL'
-            
-            # Format the SQL insert statement
-            sql = insert_template.format(
-                original_id,
-                day,
-                score,
-                active_calories,
-                steps,
-                calories_out
-            )
-            
-            # Write to output file
-            f_out.write(sql)
+    # Column types, for the columns that were found in the CSV
+    kinds = {table_column: kind for table_column, _, kind, _ in entry["columns"]}
+    
+    # Build the VALUES list a column at a time instead of formatting row by row
+    values = None
+    for table_column in clean.columns:
+        literals = sql_literals(clean[table_column], kinds[table_column])
+        values = literals if values is None else values + ", " + literals
     
-    print(f"Activity data SQL insert statements generated in {output_file}")
+    prefix, suffix = INSERT_TEMPLATE.format(
+        entry["table"], ", ".join(clean.columns), "\0", on_conflict_clause(entry, clean.columns)
+    ).split("\0")
+    return (prefix + values + suffix).tolist()
 
-def generate_inserts_for_readiness(csv_file, output_file):
-    """Generate SQL inserts for oura_readiness table from CSV file"""
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
-    VALUES ('{}', '{}', {}, '{}');
+def generate_inserts(name, csv_file, output_file):
     """
+    Generate SQL inserts for a data type's table from its CSV file.
+    The CSV is validated first (see validate_data.py); rejected rows go to the
+    quarantine file and a CSV that no longer matches the table raises SchemaDriftError.
+    """
+    # pandas is only needed once we validate, not for downloads
+    from validate_data import validate_csv
     
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        next(reader)  # Skip header row
-        
-        for row in reader:
-            # Skip empty rows
-            if len(row) < 5:
-                continue
-                
-            # Extract data (skipping the first index column)
-            _, original_id, contributors, day, score = row
-            
-            # Clean up the contributors JSON string - replace single quotes with double quotes
-            contributors = contributors.replace("'", '"')
-            
-            # Format the SQL insert statement
-            sql = insert_template.format(
-                original_id,
-                day,
-                score or 'NULL',
-                contributors
-            )
-            
-            # Write to output file
-            f_out.write(sql)
+    entry = get_data_type(name)
+    clean, rejected_count = validate_csv(name, csv_file)
     
-    print(f"Readiness data SQL insert statements generated in {output_file}")
+    with open(output_file, 'w') as f_out:
+        f_out.writelines(build_insert_statements(entry, clean))
+    
+    print(f"{entry['label'].capitalize()} data SQL insert statements generated in {output_file}")
+    print(f"Total {entry['label']} records: {len(clean)} written, {rejected_count} rejected")
+
+# Downloads are streamed to disk in chunks of this size, so memory use stays flat
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+def file_sha256(filename, hasher=None):
+    """Return a sha256 hasher fed with the contents of filename (read in chunks)."""
+    hasher = hasher or hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher
 
-def generate_inserts_for_sleep_time(csv_file, output_file):
-    """Generate SQL inserts for oura_sleep_time table from CSV file"""
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('{}', '{}', '{}', '{}', {});
+def split_source(source):
     """
+    Split a download source into (URL, target filename, expected sha256).
+    'TYPE=URL' saves the download as that data type's CSV file (see data_types.py),
+    so prepare picks it up. A plain URL keeps its file name if that ends in .csv,
+    otherwise it gets a name derived from the whole URL.
+    """
+    name, _, rest = source.partition('=')
+    if name in DATA_TYPES and rest.startswith('http'):
+        source, target_filename = rest, DATA_TYPES[name]['csv_file']
+    else:
+        target_filename = None
     
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        next(reader)  # Skip header row
-        
-        for row in reader:
-            # Skip empty rows
-            if len(row) < 6:
-                continue
-                
-            # Extract data (skipping the first index column)
-            _, original_id, day, bedtime_start, bedtime_end, duration = row
-            
-            # Format the SQL insert statement
-            sql = insert_template.format(
-                original_id,
-                day,
-                bedtime_start,
-                bedtime_end,
-                duration or 'NULL'
-            )
-            
-            # Write to output file
-            f_out.write(sql)
+    parsed = urlparse(source)
+    # Take the expected checksum from the URL fragment
+    expected_sha256 = parsed.fragment[len('sha256='):] if parsed.fragment.startswith('sha256=') else None
+    url = parsed._replace(fragment='').geturl()
     
-    print(f"Sleep time data SQL insert statements generated in {output_file}")
+    if not target_filename:
+        target_filename = os.path.basename(parsed.path)
+        # If the URL ends with a weird token, name the file after the URL itself
+        if not target_filename.endswith('.csv'):
+            target_filename = f"downloaded_{hashlib.sha256(url.encode()).hexdigest()[:12]}.csv"
+    return url, target_filename, expected_sha256
+
+def parse_content_range(value):
+    """Parse a 'bytes start-end/total' or 'bytes */total' header into (start, total); None for unknown parts."""
+    try:
+        unit, _, spec = (value or '').partition(' ')
+        byte_range, _, total = spec.partition('/')
+        start = None if byte_range == '*' else int(byte_range.split('-')[0])
+        return start, (None if total in ('', '*') else int(total))
+    except ValueError:
+        return None, None
+
+def discard_partial(part_filename):
+    """Remove a partial download and its saved ETag/Last-Modified."""
+    for filename in (part_filename, part_filename + '.meta'):
+        if os.path.exists(filename):
+            os.remove(filename)
 
-def download_csv_if_url(source, target_filename=None):
+def download_csv_if_url(source, target_filename=None, expected_sha256=None):
     """
-    If source is a URL, download it to target_filename.
+    If source is a URL (or TYPE=URL), download it to target_filename.
     If source is a local file, return the path.
+    
+    The download is streamed to a .part file and renamed once complete. If a
+    .part file is left over from an interrupted download, it is resumed with
+    an HTTP Range request, guarded by If-Range so a file that changed on the
+    server is downloaded again from the start. The checksum can be given as
+    expected_sha256 or as a '#sha256=<hex>' URL fragment; a mismatch deletes the file.
     """
     # Check if the source is a URL
-    if source.startswith('http'):
-        # Parse the URL to get the filename if no target specified
-        if not target_filename:
-            path = urlparse(source).path
-            target_filename = os.path.basename(path)
-            # If the URL ends with a weird token, use a default name
-            if not target_filename.endswith('.csv'):
-                target_filename = f"downloaded_{len(source) % 1000}.csv"
+    if source.startswith('http') or source.partition('=')[2].startswith('http'):
+        url, default_target, url_sha256 = split_source(source)
+        target_filename = target_filename or default_target
+        expected_sha256 = expected_sha256 or url_sha256
         
-        print(f"Downloading {source} to {target_filename}...")
+        part_filename = target_filename + '.part'
+        meta_filename = part_filename + '.meta'
+        print(f"Downloading {url} to {target_filename}...")
         try:
-            response = requests.get(source)
-            response.raise_for_status()  # Raise an exception for HTTP errors
+            # Only needed when downloading, so keep it out of module import time
+            import requests
             
-            with open(target_filename, 'wb') as f:
-                f.write(response.content)
+            # Resume from a previous partial download, but only if we know which
+            # version of the file it came from
+            validator = None
+            if os.path.exists(meta_filename):
+                with open(meta_filename) as f:
+                    validator = f.read().strip() or None
+            if os.path.exists(part_filename) and not validator:
+                discard_partial(part_filename)
+            resume_from = os.path.getsize(part_filename) if os.path.exists(part_filename) else 0
+            # Ask for the file as stored: with gzip, iter_content would write decoded bytes
+            # and the .part size would no longer be an offset into what the server sends
+            headers = {'Accept-Encoding': 'identity'}
+            if resume_from:
+                headers.update({'Range': f'bytes={resume_from}-', 'If-Range': validator})
             
-            print(f"Successfully downloaded to {target_filename}")
+            with requests.get(url, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code == 416:
+                    # Range not satisfiable: fine only if the .part file is exactly the whole file
+                    _, total = parse_content_range(response.headers.get('Content-Range'))
+                    if total != resume_from:
+                        print(f"  {part_filename} does not match the file on the server, starting over")
+                        discard_partial(part_filename)
+                        return download_csv_if_url(source, target_filename, expected_sha256)
+                    print(f"  {part_filename} is already complete")
+                    hasher = file_sha256(part_filename)
+                else:
+                    response.raise_for_status()  # Raise an exception for HTTP errors
+                    
+                    start, _ = parse_content_range(response.headers.get('Content-Range'))
+                    if resume_from and response.status_code == 206 and start == resume_from:
+                        print(f"  Resuming from byte {resume_from}")
+                        hasher = file_sha256(part_filename)
+                        mode = 'ab'
+                    elif response.status_code == 206:
+                        # A range we didn't ask for: don't splice it onto the .part file
+                        raise ValueError(f"unexpected Content-Range {response.headers.get('Content-Range')!r}")
+                    else:
+                        # Nothing to resume, or the file changed (If-Range failed): start over
+                        hasher = hashlib.sha256()
+                        mode = 'wb'
+                        # Remember which version of the file this is, for resuming later
+                        with open(meta_filename, 'w') as f:
+                            f.write(response.headers.get('ETag') or response.headers.get('Last-Modified') or '')
+                    
+                    with open(part_filename, mode) as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            hasher.update(chunk)
+            
+            checksum = hasher.hexdigest()
+            if expected_sha256 and checksum != expected_sha256.lower():
+                discard_partial(part_filename)
+                print(f"Error downloading file: checksum mismatch for {target_filename} "
+                      f"(expected {expected_sha256}, got {checksum})")
+                return None
+            
+            os.replace(part_filename, target_filename)
+            if os.path.exists(meta_filename):
+                os.remove(meta_filename)
+            print(f"Successfully downloaded to {target_filename} (sha256 {checksum})")
             return target_filename
         except Exception as e:
+            # Keep the .part file so the next run can resume
             print(f"Error downloading file: {e}")
             return None
     else:
         # It's a local file path
         return source
 
-def find_index_column(csv_file):
+def download_csvs(sources, max_workers=4):
     """
-    Determine which column is likely the index column (often unnamed or with values 0,1,2,...)
-    Returns the index of the index column, or None if not found.
+    Download several CSV URLs (or TYPE=URL sources) at the same time; local paths are returned as is.
+    Returns the list of local filenames, with None for any download that failed.
+    Sources that would be saved to the same file are not downloaded at all.
     """
-    try:
-        with open(csv_file, 'r') as f:
-            reader = csv.reader(f)
-            headers = next(reader)
-            
-            # If there's an empty header, that's likely the index column
-            for i, header in enumerate(headers):
-                if header.strip() == '':
-                    return i
-            
-            # If not, read the first few rows and look for a column with values 0,1,2,...
-            rows = []
-            for i, row in enumerate(reader):
-                if i < 5:  # Check first 5 rows
-                    rows.append(row)
-                else:
-                    break
-            
-            # If we have at least 3 rows
-            if len(rows) >= 3:
-                for col_idx in range(len(rows[0])):
-                    # Check if this column contains sequential integers starting from 0
-                    values = [row[col_idx] for row in rows if col_idx < len(row)]
-                    if all(val.isdigit() for val in values):
-                        # Check if they're sequential
-                        ints = [int(val) for val in values]
-                        expected = list(range(min(ints), min(ints) + len(ints)))
-                        if ints == expected:
-                            return col_idx
-            
-            # If we couldn't find an index column, return None
-            return None
-            
-    except Exception as e:
-        print(f"Error finding index column: {e}")
-        return None
-
-def print_sample_data(csv_file, num_rows=3):
-    """Print sample data from a CSV file to help understand its structure."""
-    print(f"\nSample data from {csv_file}:")
-    try:
-        with open(csv_file, 'r') as f:
-            reader = csv.reader(f)
-            headers = next(reader)
-            print(f"Headers: {headers}")
-            
-            # Try to find the index column
-            index_col = find_index_column(csv_file)
-            if index_col is not None:
-                print(f"Detected index column at position {index_col}")
-            
-            rows = []
-            for i, row in enumerate(reader):
-                if i < num_rows:
-                    rows.append(row)
-                else:
-                    break
-            
-            # Print each row with column indices
-            for i, row in enumerate(rows):
-                print(f"Row {i+1}:")
-                for j, val in enumerate(row):
-                    print(f"  [Col {j}]: {val}")
-    except Exception as e:
-        print(f"Error reading sample data: {e}")
-
-def generate_inserts_for_spo2(csv_file, output_file):
-    """Generate SQL inserts for oura_spo2 table from CSV file"""
-    # Print sample data to understand structure
-    print_sample_data(csv_file)
-    
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('{}', '{}', {}, {});
-    """
-    
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        header = next(reader)  # Get header row
-        print(f"SPO2 CSV headers: {header}")  # Print headers to understand structure
-        
-        # Find column positions (with defaults for common patterns)
-        # The default values are guesses based on typical CSV exports
-        id_col = header.index('id') if 'id' in header else 1
-        day_col = header.index('day') if 'day' in header else 2
-        spo2_col = 3  # Default position
-        
-        # Try to find spo2_percentage column
-        for possible_name in ['spo2_percentage', 'spo2', 'avg_spo2', 'average_spo2']:
-            if possible_name in header:
-                spo2_col = header.index(possible_name)
-                break
-        
-        bdi_col = 4  # Default position
-        # Try to find breathing disturbance index column
-        for possible_name in ['breathing_disturbance_index', 'bdi', 'breathing_index']:
-            if possible_name in header:
-                bdi_col = header.index(possible_name)
-                break
-        
-        for row in reader:
-            # For debugging, print the actual columns in the first row
-            if reader.line_num == 2:  # First data row
-                print(f"First SPO2 row: {row}")
-            
-            # Skip empty rows
-            if len(row) < 3:
-                continue
-            
-            try:
-                # Extract data using column positions
-                original_id = row[id_col] if id_col < len(row) else ''
-                day = row[day_col] if day_col < len(row) else ''
-                
-                # Handle spo2_percentage carefully since it's JSON
-                spo2_percentage = 'NULL'
-                if spo2_col < len(row) and row[spo2_col]:
-                    # Format as proper JSON by replacing single quotes with double quotes
-                    spo2_json = row[spo2_col].replace("'", '"')
-                    
-                    # If the JSON is valid, quote it for SQL
-                    if spo2_json and spo2_json.lower() != 'null':
-                        spo2_percentage = f"'{spo2_json}'"
-                
-                # Handle breathing_disturbance_index
-                breathing_disturbance_index = 'NULL'
-                if bdi_col < len(row) and row[bdi_col]:
-                    breathing_disturbance_index = row[bdi_col]
-                
-                # Format the SQL insert statement
-                sql = insert_template.format(
-                    original_id,
-                    day,
-                    spo2_percentage,  # Already formatted as 'NULL' or quoted JSON
-                    breathing_disturbance_index
-                )
-                
-                # Write to output file
-                f_out.write(sql)
-                
-            except Exception as e:
-                print(f"Error processing SPO2 row {reader.line_num}: {e}")
-                print(f"Row data: {row}")
+    if not sources:
+        return []
     
-    print(f"SPO2 data SQL insert statements generated in {output_file}")
-
-def generate_inserts_for_stress(csv_file, output_file):
-    """Generate SQL inserts for oura_stress table from CSV file"""
-    # SQL insert statement template
-    insert_template = """
-    INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('{}', '{}', {}, {}, '{}');
-    """
+    # Two downloads into one file would corrupt each other
+    targets = {}
+    for source in sources:
+        if source.startswith('http') or source.partition('=')[2].startswith('http'):
+            targets.setdefault(split_source(source)[1], []).append(source)
+    clashes = {source for same in targets.values() if len(same) > 1 for source in same}
+    for target, same in targets.items():
+        if len(same) > 1:
+            print(f"ERROR: {', '.join(same)} would all be saved as {target}; use TYPE=URL to name them")
+        elif target not in {entry['csv_file'] for entry in DATA_TYPES.values()}:
+            print(f"Note: {target} is not a data type CSV, so prepare won't process it (use TYPE=URL)")
     
-    # Read CSV and generate SQL statements
-    with open(csv_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        reader = csv.reader(f_in)
-        next(reader)  # Skip header row
-        
-        for row in reader:
-            # Skip empty rows
-            if len(row) < 6:
-                continue
-                
-            # Extract data (skipping the first index column)
-            _, original_id, day, stress_high, recovery_high, day_summary = row
-            
-            # Format the SQL insert statement
-            sql = insert_template.format(
-                original_id,
-                day,
-                stress_high or 'NULL',
-                recovery_high or 'NULL',
-                day_summary
-            )
-            
-            # Write to output file
-            f_out.write(sql)
+    to_download = [source for source in sources if source not in clashes]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_download) or 1))) as executor:
+        results = dict(zip(to_download, executor.map(download_csv_if_url, to_download)))
+    downloaded = [results.get(source) for source in sources]
     
-    print(f"Stress data SQL insert statements generated in {output_file}")
+    failed = downloaded.count(None)
+    print(f"Downloaded {len(sources) - failed}/{len(sources)} file(s).")
+    if failed:
+        print("Run the same command again to resume the failed downloads.")
+    return downloaded
 
 def create_jsonb_update_statements(output_file):
     """Generate SQL statements to convert text fields to JSONB format"""
@@ -512,50 +261,46 @@ def create_jsonb_update_statements(output_file):
     
     print(f"JSONB update statements generated in {output_file}")
 
-def main():
-    """Process all CSV files and generate SQL insert statements."""
-    # Create output directory if it doesn't exist
-    os.makedirs('sql_inserts', exist_ok=True)
+def prepare_all(data_types=None):
+    """
+    Generate SQL insert statements for the given data types (all registered types by default).
+    Returns a tuple of (successful_files, total_files).
+    """
+    from validate_data import SchemaDriftError
     
-    # Handle command line arguments - allow specifying URLs for CSV files
-    if len(sys.argv) > 1:
-        # Assume the first argument is the path to a config file or a CSV URL
-        arg = sys.argv[1]
-        if arg.startswith('http') and 'csv' in arg.lower():
-            print(f"Downloading CSV from URL: {arg}")
-            downloaded = download_csv_if_url(arg)
-            if downloaded:
-                print(f"You can now process this file. Please run the script again.")
-                sys.exit(0)
+    # Create output directory if it doesn't exist
+    os.makedirs(SQL_OUTPUT_DIR, exist_ok=True)
     
-    # Define CSV files and their processors
+    # CSV files and their processors come from the data type registry
     file_processors = [
-        ('sleep_data.csv', generate_inserts_for_sleep_data, 'sql_inserts/sleep_inserts.sql'),
-        ('heart_rate_data.csv', generate_inserts_for_heart_rate, 'sql_inserts/heart_rate_inserts.sql'),
-        ('daily_data.csv', generate_inserts_for_activity, 'sql_inserts/activity_inserts.sql'),
-        ('daily_readiness.csv', generate_inserts_for_readiness, 'sql_inserts/readiness_inserts.sql'),
-        ('sleep_time_data.csv', generate_inserts_for_sleep_time, 'sql_inserts/sleep_time_inserts.sql'),
-        ('blood_oxygen_data.csv', generate_inserts_for_spo2, 'sql_inserts/spo2_inserts.sql'),
-        ('stress_data.csv', generate_inserts_for_stress, 'sql_inserts/stress_inserts.sql')
+        (name, entry['csv_file'], sql_path(entry))
+        for name, entry in select_data_types(data_types)
     ]
     
     successful_files = 0
     
     # Process each CSV file
-    for csv_file, processor_func, output_file in file_processors:
+    for name, csv_file, output_file in file_processors:
         print(f"\n{'='*80}\nProcessing {csv_file}...")
         
         # Check if CSV file exists
         if not os.path.exists(csv_file):
             print(f"ERROR: {csv_file} not found in current directory.")
             print(f"Please make sure {csv_file} is in the same directory as this script.")
-            print(f"You can also run 'python {sys.argv[0]} URL_TO_CSV' to download from URL.")
+            print(f"You can also run 'python oura.py prepare {name}=URL_TO_CSV' to download it from a URL.")
             continue
         
         try:
-            # Process the CSV file
-            processor_func(csv_file, output_file)
+            # Validate the CSV file and generate its SQL inserts
+            generate_inserts(name, csv_file, output_file)
             successful_files += 1
+        except SchemaDriftError as e:
+            # The CSV no longer matches the table; stop before generating anything, and
+            # remove SQL from an earlier run so load doesn't insert stale rows
+            print(f"ERROR: schema drift in {csv_file}: {e}")
+            if os.path.exists(output_file):
+                os.remove(output_file)
+                print(f"Removed {output_file} from an earlier run")
         except Exception as e:
             print(f"ERROR processing {csv_file}: {e}")
             import traceback
@@ -563,7 +308,7 @@ def main():
     
     # Create JSONB update statements
     try:
-        create_jsonb_update_statements('sql_inserts/jsonb_updates.sql')
+        create_jsonb_update_statements(f'{SQL_OUTPUT_DIR}/{JSONB_UPDATES_FILE}')
         print("\nJSONB update statements created successfully.")
     except Exception as e:
         print(f"ERROR creating JSONB update statements: {e}")
@@ -578,11 +323,24 @@ def main():
         print("2. Create your tables using the database.sql script")
         print("3. Run each generated SQL file to insert data (in sql_inserts/ directory)")
         print("4. Run the jsonb_updates.sql file to convert text fields to JSONB format")
+        print("   (or run 'python oura.py load' to do steps 3 and 4 with DATABASE_URL)")
     
     if successful_files < len(file_processors):
         print("\nSome files were not processed successfully. Please check the errors above.")
         print("If files are missing, you can download them from Supabase Storage:")
-        print(f"  python {sys.argv[0]} URL_TO_CSV")
+        print("  python oura.py prepare TYPE=URL_TO_CSV [TYPE=URL_TO_CSV ...]")
+    
+    return successful_files, len(file_processors)
+
+def main():
+    """Process all CSV files and generate SQL insert statements."""
+    # Handle command line arguments - allow specifying URLs for CSV files
+    urls = [arg for arg in sys.argv[1:] if arg.startswith('http') or arg.partition('=')[2].startswith('http')]
+    if urls:
+        print(f"Downloading {len(urls)} CSV file(s)...")
+        download_csvs(urls)
+    
+    prepare_all()
 
 if __name__ == "__main__":
     main()
@@ -1,91 +1,121 @@
 
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('ca04ba9a-0ac8-4f41-82e6-d7593f814544', '121111111111111111111112211111111111111111111111111111211112222223302230000000022332223333322233222222232222222222233222222333323332223222232233233232223322222000000000000000000000000000000033222223232332222223333322222222223222222222222222211111111111111111111111111111211111111111111111', 63, 147, 3581, NULL);
+    VALUES ('ca04ba9a-0ac8-4f41-82e6-d7593f814544', '2025-03-05', 63, 147, 3581, 2093)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('66f595ba-2043-44f3-bb41-e36a1562f982', '111111111111111111111111111112211111111111111222223222222221111122233223222000000002323332222222222222222233222232333223233333333323332222322234443323333222222333344343223222223334332222232222332222222222332222222322222222221111111111111111111111211111111111111221111111111111111111111111', 63, 290, 7148, NULL);
+    VALUES ('66f595ba-2043-44f3-bb41-e36a1562f982', '2025-03-06', 63, 290, 7148, 2286)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('d767362f-a58f-4664-a0d8-a4ef2e104b3b', '111111111111111111221111111122222212122122211111111111111111111222222333223342233000000002123322223223223333333323233233233233223323232322222323222232222212222322322222234323333333222222333222222333333333333223443222212222222223222222222222212222221111111111111111111111111111111111111111', 64, 323, 7268, NULL);
+    VALUES ('d767362f-a58f-4664-a0d8-a4ef2e104b3b', '2025-03-07', 64, 323, 7268, 2312)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('fbf12d89-0b85-4250-998f-4169f5ed2827', '111111111111111211122222233333333333323334444444343344544444444444433443344444333333330000322323333233322323332233333223322322331222222233222232233233333333330000033332223333332333233322333333333322322333333322233222233222333323333222333333333333232231121122233221111211111111111111111111', 81, 1168, 23799, NULL);
+    VALUES ('fbf12d89-0b85-4250-998f-4169f5ed2827', '2025-03-08', 81, 1168, 23799, 3355)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('a5482719-9ac9-4cfc-87aa-94592249e525', '221111111111111111111112111222222332221111111111111111111111111111111111221111112222223333233233333332323300000000033322333333333222234333323333222333332222222223222222222222233323333333333332333433343222223332333333332332233332333333332222222223222323322111111111111111111111111111111111', 84, 384, 9179, NULL);
+    VALUES ('a5482719-9ac9-4cfc-87aa-94592249e525', '2025-03-09', 84, 384, 9179, 2429)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('c6f8a6e9-837b-4ccd-b2e0-b36cc20b9a1a', '111111111111111111111111111111111111211111121111122111111111112222223332320000000000332222222222222322222222222222222222222222323334333232222223222332223233222211111111111222212223322222323323332233233332332232333322322233222223222222332000003322323211111111111111111111111111111111111111', 74, 237, 5473, NULL);
+    VALUES ('c6f8a6e9-837b-4ccd-b2e0-b36cc20b9a1a', '2025-03-10', 74, 237, 5473, 2212)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('095699b2-30a8-4af6-91c0-0aa40734e3de', '111111111111111111111111111111111111121111222211111111111112232223222333322233222223222222223223232333322233333332322233233223322333223333233200023333333222332332232233222233333323232222233333333233333333333332233332223322222222221111111111111111111111111111111111111111111111121111111111', 77, 274, 6499, NULL);
+    VALUES ('095699b2-30a8-4af6-91c0-0aa40734e3de', '2025-03-11', 77, 274, 6499, 2292)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('71756c32-0e7c-4173-94ff-8a3e5ed78e4f', '111111111122211111111111111111111111111112211111111111111222222223333233223332333232222322223322223333222222332222223322323332222233223233322222230000000333332333333333333333443323323322222232222233344343222233244334333433333334343232332233322333322232112111111111111111221111111111111111', 84, 563, 11991, NULL);
+    VALUES ('71756c32-0e7c-4173-94ff-8a3e5ed78e4f', '2025-03-12', 84, 563, 11991, 2636)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('3b028e03-d980-4da7-bdb8-f6c5aeee0873', '111111111111111112222222232332233332211111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111200000000000000333322233322222222222222344442232222222234433322233333422222222223222222332211111111111111122111111111111', 90, 234, 5980, NULL);
+    VALUES ('3b028e03-d980-4da7-bdb8-f6c5aeee0873', '2025-03-13', 90, 234, 5980, 2081)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('d0390889-a9dc-43a1-aa79-1b790c22f5f6', '111111111111111111111111111111221111111111111111111111111111122111111111122222322222222222233333222000002332332233333233232223232223232222222222333322322322323432222222232222222332223323333222222222233222222222222221222222223222222222222222221111111111111111111111111111111111221111111111', 80, 160, 3510, NULL);
+    VALUES ('d0390889-a9dc-43a1-aa79-1b790c22f5f6', '2025-03-14', 80, 160, 3510, 2108)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('95809701-2a1d-4adf-a24f-4ba487af78a5', '111111111111111111111111111111111211111111112222221111111111111111113332223321223222000000333223223333323333222232333222222233223222232222333322222232232222322343223222223322322233322223332222222223222222332223211222233222222222222222232222222222222222222222223322222211111111111111111111', 68, 201, 4543, NULL);
+    VALUES ('95809701-2a1d-4adf-a24f-4ba487af78a5', '2025-03-15', 68, 201, 4543, 2219)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('24b54848-5aab-4c30-a158-8ceaa40f6c4f', '111111111111111111111111111111111121111111111111211111222222333322220000003333323322222333223322222333323333333334222333323333323333333333333332233342222233322222223333234333332232232223333322333223222222222222222222222223222232333323223333222222222333333221111111111111111111111111111111', 69, 375, 8789, NULL);
+    VALUES ('24b54848-5aab-4c30-a158-8ceaa40f6c4f', '2025-03-16', 69, 375, 8789, 2452)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('a2499b3b-1116-4d1e-9095-0941f712d29b', '111111111111111111111111111111111111111111111111111112221111111111111123332232332222233233333432233322200000022222232322233233322233223322232323222333333333233333443222222222232222233442332333222322222223322223222222323322211223222211111111111111111111111111111111111111111111111111111111', 70, 279, 6934, NULL);
+    VALUES ('a2499b3b-1116-4d1e-9095-0941f712d29b', '2025-03-17', 70, 279, 6934, 2262)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('563e1768-a3c8-43ea-a617-b39c8c6bd6cd', '112111111112221121111221111111111112211111111111111220000000000222223222232232222333333322332232223333333334432222222222222222234322222222222333333343332222322233333333233322222334323333333332223212222222332222222222222223333322211122222211111111111111111111111111121111111111111111111111', 69, 361, 9109, NULL);
+    VALUES ('563e1768-a3c8-43ea-a617-b39c8c6bd6cd', '2025-03-18', 69, 361, 9109, 2382)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('5f4d75e3-f2dd-49b9-b3b1-7167336de84e', '122111111111222111111111111111111111111111112111111111121112222222233220000002222333332223323333332323322232322232332333333333223332233232322222222222222222222323222323333332232323322222232222222223332332222332233323232333333333232222233222222222333223222222222222121111111111111111111111', 57, 232, 5594, NULL);
+    VALUES ('5f4d75e3-f2dd-49b9-b3b1-7167336de84e', '2025-03-19', 57, 232, 5594, 2301)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('785eef7b-2aa8-4a05-a275-ec2c3dfba0f5', '111111111111111111111111111111111111223322222221111111111121111111111111222222222222223322232233323322232332333332222233220000002233333222333233443223222222222334432222232222232334442222222323333333333332222222222223222222222222222332233222222222222222332211111111111122111111111111111111', 50, 339, 8551, NULL);
+    VALUES ('785eef7b-2aa8-4a05-a275-ec2c3dfba0f5', '2025-03-20', 50, 339, 8551, 2341)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('b03a1df6-cdfe-4534-9ead-74039d811234', '111111111111211111111111111112233222211111111111111111111111111111111111222222122222222233222333333340000022233332232222333333223322333323322222223222232222232233233223332223322223332233332333322333322322322332222233232233332233332234432222222222222223343222222222233222222222221222323221', 52, 335, 7957, NULL);
+    VALUES ('b03a1df6-cdfe-4534-9ead-74039d811234', '2025-03-21', 52, 335, 7957, 2423)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('3cd5b394-4361-4cae-a359-7b2e3519515f', '222321111111111111111111111111111111111111111111111111111112233333333222332111111111111111111111111111111222223323323233222322222223223222222222222222232300000000000000000023220000000222322223233223332333333222333333233222333332223322233322333322222222222111111111111111111111111111111111', 55, 202, 4987, NULL);
+    VALUES ('3cd5b394-4361-4cae-a359-7b2e3519515f', '2025-03-22', 55, 202, 4987, 2156)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('27c2ba6d-96da-42b8-9093-a645c7dd5be4', '111111111111111111111111111111111111111111111111112222222223221242000332333323333222212222222222233333332233233333233333333222222223222222222222222222222211111111111111122222222222232223333343333433333233332112322000000000000000022221123222222322223323322111111111111111121111111111111111', 54, 301, 6988, NULL);
+    VALUES ('27c2ba6d-96da-42b8-9093-a645c7dd5be4', '2025-03-23', 54, 301, 6988, 2283)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('a3ed453b-21b2-4ca0-a544-559b8615bfac', '111111111111111111111111111111111111111111221211211211111111121222222223223223322332222222222233232233322233333000000000000003322222232323232233333332233433232222222222332322223222222223222222233233333222223233332222232322232222222232222232222222223222222222111111111111111111111111111111', 50, 203, 4667, NULL);
+    VALUES ('a3ed453b-21b2-4ca0-a544-559b8615bfac', '2025-03-24', 50, 203, 4667, 2229)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('5df465a2-8124-456f-a679-546490ea45fa', '111111111111111111111111111122111111111111112111111111112111111111221111112222222222222223222222322322222322300000003333333333233322222222232222223222223333333333333233333333233232233232232222222232000033222222222223222223333232232222222333223222222222221111112111111111111111111112111111', 50, 224, 5496, NULL);
+    VALUES ('5df465a2-8124-456f-a679-546490ea45fa', '2025-03-25', 50, 224, 5496, 2218)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('d92dfd18-c2ec-4568-a38f-15fee8a238c8', '121111111111111111111111111211111111111111111111211111111111232232222222211111112221122233233333233222323322232222332223232332322332332332223232223322323222333222233223233332233333333222222333222222323333223322222222222222222222223322200032222222222222222222222111111111111111111111111111', 47, 184, 4315, NULL);
+    VALUES ('d92dfd18-c2ec-4568-a38f-15fee8a238c8', '2025-03-26', 47, 184, 4315, 2223)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('04477473-ac56-4dcc-9893-009b61e38a85', '111111111111111111111112111111111111111112212212111222222232233322232223222232222332332223333222223222333322232222222333222233222232322222222222222222222222222223233223322233332223223333323223323223322200000233333232333332333222232222222322222211111222211111112111111111111111111111111111', 46, 212, 5125, NULL);
+    VALUES ('04477473-ac56-4dcc-9893-009b61e38a85', '2025-03-27', 46, 212, 5125, 2292)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('9fe3c41d-b7bb-4df5-a918-6c202cf8b45c', '111111111111111111111111111111111111111111111111111111112222223222222211111111111112332333333333323333233332332222222222222222222222222223222232200003323232233222200000000000000000000000002322222332222223223232322332223323332222222223222222222222222222222222211111111111111111111111111111', 47, 140, 3393, NULL);
+    VALUES ('9fe3c41d-b7bb-4df5-a918-6c202cf8b45c', '2025-03-28', 47, 140, 3393, 2122)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('5776a54c-cd36-4119-af7e-4931819740fb', '111111111111111111111111111111111211111111111112232223332222222222232233330323332232222333333333233323333333333433334434443322333333322222223223332233333330000000233333333333333332233344332223222234333343333332222232333332333323233222222322222232322223211111221111112342232222222111111111', 68, 834, 15641, NULL);
+    VALUES ('5776a54c-cd36-4119-af7e-4931819740fb', '2025-03-29', 68, 834, 15641, 2952)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('2bffd7d6-e378-4253-a62d-6bdf24594b6f', '111211111111111111111111111111111111112111111111211111111112112222323300000004333322222222222222333333223223333333322233223223333333233332333343332111233332321111222332222222322223323333332233322222232332233333002322333233333232232322222223241232222332222222211111111111111111111111111111', 71, 344, 7989, NULL);
+    VALUES ('2bffd7d6-e378-4253-a62d-6bdf24594b6f', '2025-03-30', 71, 344, 7989, 2368)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('0ea7d418-aed1-46cb-89d5-a9e14200820e', '111111111111111111111111111111111111111111111121111111111112211111111122223232322222332222332223222232330000333333323333333333333332222322322333333332232222332222322344222232232234432322232222232232333322222232224332222222222222222232222221111111111111111111111111111111112111111121111111', 73, 322, 7893, NULL);
+    VALUES ('0ea7d418-aed1-46cb-89d5-a9e14200820e', '2025-03-31', 73, 322, 7893, 2307)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('b191d5d6-704d-4574-95dc-d7953d0b5e2c', '111111111111112221111111111111111111111111112111222222232222222233300000000000000000222222223332200000003332233332223233433222222234432222222222223443222222222243223332333333223222234423333333322332222233332222222222222332323200022222222111111111111111111111112111111111111111111111111111', 75, 353, 8519, NULL);
+    VALUES ('b191d5d6-704d-4574-95dc-d7953d0b5e2c', '2025-04-01', 75, 353, 8519, 2366)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('3c0f1e62-6179-4601-8cf7-58f5772de6a1', '111111111111122211211111111111111111111112111111111111112222222223221122200000000000002222222222222223323023222222323232322243222000333322222322222223232233332332222323222222222222222223323222222222222222222223222222222233223222222111111111112111111111111111111111112211111111111111111111', 71, 135, 3161, NULL);
+    VALUES ('3c0f1e62-6179-4601-8cf7-58f5772de6a1', '2025-04-02', 71, 135, 3161, 2117)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
     INSERT INTO public.oura_activity (original_id, day, score, active_calories, steps, calories_out)
-    VALUES ('91d65fc6-b0cb-451f-a500-2d6ca2412d4c', '111111111111111211111111111112111111111111111111111222212222222222232232222223222222322222223223232332200000232223233333333322333333332333333344444432232232233222233322222322233333323222033222222222222222322222222222222222222222222222222222211111111111111111111111112111111111111111211111', 77, 759, 9242, NULL);
+    VALUES ('91d65fc6-b0cb-451f-a500-2d6ca2412d4c', '2025-04-03', 77, 759, 9242, 2775)
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, active_calories = EXCLUDED.active_calories, steps = EXCLUDED.steps, calories_out = EXCLUDED.calories_out, updated_at = NOW();
     
\ No newline at end of file
@@ -0,0 +1,125 @@
+
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('35cda3b6-ca88-4c4d-aef0-9a0baf771eb2', '2025-03-05', 86, '{"activity_balance": 98, "body_temperature": 90, "hrv_balance": 73, "previous_day_activity": 83, "previous_night": 89, "recovery_index": 76, "resting_heart_rate": 99, "sleep_balance": 84}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('85ed9f64-52eb-46b6-b6b5-7cd37e2d3b4b', '2025-03-06', 85, '{"activity_balance": 97, "body_temperature": 99, "hrv_balance": 84, "previous_day_activity": 84, "previous_night": 83, "recovery_index": 68, "resting_heart_rate": 99, "sleep_balance": 75}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('bce6197a-368d-4c13-9400-c18049ec5c55', '2025-03-07', 80, '{"activity_balance": 96, "body_temperature": 67, "hrv_balance": 71, "previous_day_activity": 84, "previous_night": 89, "recovery_index": 76, "resting_heart_rate": 91, "sleep_balance": 87}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('a7e9db24-4be3-4059-a481-54cdbaf53350', '2025-03-08', 68, '{"activity_balance": 96, "body_temperature": 74, "hrv_balance": 79, "previous_day_activity": 80, "previous_night": 45, "recovery_index": 14, "resting_heart_rate": 82, "sleep_balance": 65}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('58c92c87-cc7a-4972-abd7-acf89be2aa61', '2025-03-09', 66, '{"activity_balance": 69, "body_temperature": 88, "hrv_balance": 72, "previous_day_activity": 48, "previous_night": 61, "recovery_index": 88, "resting_heart_rate": 33, "sleep_balance": 84}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('405223b8-89db-4506-9d7e-8fa6d43ada8b', '2025-03-10', 62, '{"activity_balance": 95, "body_temperature": 93, "hrv_balance": 61, "previous_day_activity": 92, "previous_night": 65, "recovery_index": 29, "resting_heart_rate": 17, "sleep_balance": 72}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('152ee6fa-bdd0-4320-b612-5dad84488242', '2025-03-11', 72, '{"activity_balance": 74, "body_temperature": 100, "hrv_balance": 74, "previous_day_activity": 86, "previous_night": 76, "recovery_index": 51, "resting_heart_rate": 68, "sleep_balance": 72}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('e13c628c-58e6-4edd-9f68-aca14bcba7d5', '2025-03-12', 84, '{"activity_balance": 73, "body_temperature": 100, "hrv_balance": 59, "previous_day_activity": 95, "previous_night": 100, "recovery_index": 100, "resting_heart_rate": 94, "sleep_balance": 79}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('dc0efe10-ef57-4dd0-96d8-ceec0a4896fb', '2025-03-13', 52, '{"activity_balance": 67, "body_temperature": 88, "hrv_balance": 48, "previous_day_activity": 79, "previous_night": 33, "recovery_index": 8, "resting_heart_rate": 52, "sleep_balance": 58}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('f0308070-1504-4e67-9b19-2244649a37bf', '2025-03-14', 77, '{"activity_balance": 79, "body_temperature": 81, "hrv_balance": 61, "previous_day_activity": 99, "previous_night": 76, "recovery_index": 100, "resting_heart_rate": 62, "sleep_balance": 80}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('6919e441-ed46-483d-bd6d-356f3c15a7a6', '2025-03-15', 80, '{"activity_balance": 79, "body_temperature": 83, "hrv_balance": 59, "previous_day_activity": 86, "previous_night": 87, "recovery_index": 100, "resting_heart_rate": 88, "sleep_balance": 70}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('3284b3ee-7e98-43e6-bf10-209d2eec9c2a', '2025-03-16', 72, '{"activity_balance": 80, "body_temperature": 100, "hrv_balance": 58, "previous_day_activity": 79, "previous_night": 60, "recovery_index": 94, "resting_heart_rate": 79, "sleep_balance": 62}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('4d816fbb-73ce-48ca-b201-721cc37b830a', '2025-03-17', 73, '{"activity_balance": 82, "body_temperature": 100, "hrv_balance": 59, "previous_day_activity": 85, "previous_night": 85, "recovery_index": 60, "resting_heart_rate": 63, "sleep_balance": 76}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('d8bd1e39-219c-4a4a-b93b-6b8c955ee7f4', '2025-03-18', 82, '{"activity_balance": 89, "body_temperature": 100, "hrv_balance": 71, "previous_day_activity": 92, "previous_night": 85, "recovery_index": 98, "resting_heart_rate": 80, "sleep_balance": 70}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('4d5aca36-f6c6-402b-b6d0-f860d62242d8', '2025-03-19', 85, '{"activity_balance": 86, "body_temperature": 100, "hrv_balance": 69, "previous_day_activity": 84, "previous_night": 99, "recovery_index": 88, "resting_heart_rate": 100, "sleep_balance": 76}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('965da494-1953-42cd-9c28-7ed349ac0cba', '2025-03-20', 77, '{"activity_balance": 92, "body_temperature": 100, "hrv_balance": 71, "previous_day_activity": 82, "previous_night": 58, "recovery_index": 100, "resting_heart_rate": 79, "sleep_balance": 72}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('f90b4bf5-0097-497d-ac8e-cf9076f5680e', '2025-03-21', 78, '{"activity_balance": 87, "body_temperature": 85, "hrv_balance": 76, "previous_day_activity": 85, "previous_night": 71, "recovery_index": 92, "resting_heart_rate": 63, "sleep_balance": 80}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('e723a92e-bfec-403d-96e0-216933b2475a', '2025-03-22', 65, '{"activity_balance": 92, "body_temperature": 78, "hrv_balance": 56, "previous_day_activity": 80, "previous_night": 42, "recovery_index": 22, "resting_heart_rate": 80, "sleep_balance": 76}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('45c6eb41-1933-474d-9190-0e690aaf8dab', '2025-03-23', 76, '{"activity_balance": 93, "body_temperature": 98, "hrv_balance": 74, "previous_day_activity": 94, "previous_night": 73, "recovery_index": 78, "resting_heart_rate": 55, "sleep_balance": 77}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('3a1cc5b9-0964-4345-b635-c1a27b6d46b4', '2025-03-24', 77, '{"activity_balance": 90, "body_temperature": 95, "hrv_balance": 58, "previous_day_activity": 86, "previous_night": 80, "recovery_index": 76, "resting_heart_rate": 73, "sleep_balance": 82}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('ee5e8953-93fe-406f-80c3-2cf05002d5e7', '2025-03-25', 78, '{"activity_balance": 96, "body_temperature": 100, "hrv_balance": 57, "previous_day_activity": 82, "previous_night": 85, "recovery_index": 68, "resting_heart_rate": 81, "sleep_balance": 80}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('dc948fa4-5174-407d-858d-a9ed63dcc728', '2025-03-26', 67, '{"activity_balance": 93, "body_temperature": 100, "hrv_balance": 65, "previous_day_activity": 88, "previous_night": 44, "recovery_index": 1, "resting_heart_rate": 90, "sleep_balance": 75}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('77b53e05-6607-4efa-a5bd-ccdfefaee0ef', '2025-03-27', 74, '{"activity_balance": 98, "body_temperature": 89, "hrv_balance": 64, "previous_day_activity": 89, "previous_night": 44, "recovery_index": 62, "resting_heart_rate": 98, "sleep_balance": 70}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('e296ab9e-66b6-4a4a-b139-80a55ab1225b', '2025-03-28', 82, '{"activity_balance": 99, "body_temperature": 88, "hrv_balance": 63, "previous_day_activity": 83, "previous_night": 78, "recovery_index": 87, "resting_heart_rate": 90, "sleep_balance": 82}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('a5bd2033-e851-4713-9b7c-234355c4b6df', '2025-03-29', 79, '{"activity_balance": 98, "body_temperature": 100, "hrv_balance": 79, "previous_day_activity": 82, "previous_night": 63, "recovery_index": 71, "resting_heart_rate": 100, "sleep_balance": 66}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('92c84dc2-165e-42df-a1e6-e6eabcb9bdf9', '2025-03-30', 60, '{"activity_balance": 82, "body_temperature": 87, "hrv_balance": 61, "previous_day_activity": 68, "previous_night": 39, "recovery_index": 35, "resting_heart_rate": 55, "sleep_balance": 70}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('83e2875d-467e-469e-99eb-77335d4e1f67', '2025-03-31', 79, '{"activity_balance": 97, "body_temperature": 78, "hrv_balance": 81, "previous_day_activity": 85, "previous_night": 65, "recovery_index": 82, "resting_heart_rate": 81, "sleep_balance": 70}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('314024e8-f115-4f61-86de-98fe81a5b694', '2025-04-01', 82, '{"activity_balance": 85, "body_temperature": 78, "hrv_balance": 72, "previous_day_activity": 89, "previous_night": 85, "recovery_index": 79, "resting_heart_rate": 98, "sleep_balance": 67}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('e366759a-cb15-4a11-a4c2-4db2c4000b80', '2025-04-02', 84, '{"activity_balance": 82, "body_temperature": 100, "hrv_balance": 78, "previous_day_activity": 82, "previous_night": 88, "recovery_index": 88, "resting_heart_rate": 98, "sleep_balance": 72}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('aa44bd9f-2c62-48a5-8604-f0d1ad43889e', '2025-04-03', 87, '{"activity_balance": 89, "body_temperature": 98, "hrv_balance": 82, "previous_day_activity": 84, "previous_night": 100, "recovery_index": 83, "resting_heart_rate": 97, "sleep_balance": 75}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
+    INSERT INTO public.oura_readiness (original_id, day, score, contributors)
+    VALUES ('d2603392-a42f-4140-bcb1-746f30c6ae48', '2025-04-04', 81, '{"activity_balance": 66, "body_temperature": 99, "hrv_balance": 87, "previous_day_activity": 67, "previous_night": 79, "recovery_index": 84, "resting_heart_rate": 97, "sleep_balance": 75}')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, updated_at = NOW();
+    
\ No newline at end of file
@@ -1,94 +1,125 @@
 
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('4449e66e-323a-4636-b966-0c2033ce4f39', '2025-03-05', 82, '{"deep_sleep": 75, "efficiency": 97, "latency": 89, "rem_sleep": 89, "restfulness": 76, "timing": 55, "total_sleep": 87}', '2025-03-05T00:00:00+00:00');
+    VALUES ('4449e66e-323a-4636-b966-0c2033ce4f39', '2025-03-05', 82, '{"deep_sleep": 75, "efficiency": 97, "latency": 89, "rem_sleep": 89, "restfulness": 76, "timing": 55, "total_sleep": 87}', '2025-03-05T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('9b03b9cf-cb8d-410f-add7-06e904a0eaa9', '2025-03-06', 79, '{"deep_sleep": 93, "efficiency": 96, "latency": 97, "rem_sleep": 56, "restfulness": 80, "timing": 71, "total_sleep": 72}', '2025-03-06T00:00:00+00:00');
+    VALUES ('9b03b9cf-cb8d-410f-add7-06e904a0eaa9', '2025-03-06', 79, '{"deep_sleep": 93, "efficiency": 96, "latency": 97, "rem_sleep": 56, "restfulness": 80, "timing": 71, "total_sleep": 72}', '2025-03-06T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('a2742c8f-7434-4c0a-8373-50fc4b6b4870', '2025-03-07', 82, '{"deep_sleep": 94, "efficiency": 81, "latency": 89, "rem_sleep": 50, "restfulness": 61, "timing": 78, "total_sleep": 97}', '2025-03-07T00:00:00+00:00');
+    VALUES ('a2742c8f-7434-4c0a-8373-50fc4b6b4870', '2025-03-07', 82, '{"deep_sleep": 94, "efficiency": 81, "latency": 89, "rem_sleep": 50, "restfulness": 61, "timing": 78, "total_sleep": 97}', '2025-03-07T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('d9585555-d7fa-4ab6-992a-dac1abbcdeac', '2025-03-08', 62, '{"deep_sleep": 70, "efficiency": 90, "latency": 86, "rem_sleep": 31, "restfulness": 75, "timing": 95, "total_sleep": 38}', '2025-03-08T00:00:00+00:00');
+    VALUES ('d9585555-d7fa-4ab6-992a-dac1abbcdeac', '2025-03-08', 62, '{"deep_sleep": 70, "efficiency": 90, "latency": 86, "rem_sleep": 31, "restfulness": 75, "timing": 95, "total_sleep": 38}', '2025-03-08T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('c0bc2af9-b891-4b3e-bd8d-5d09d3437b51', '2025-03-09', 69, '{"deep_sleep": 84, "efficiency": 76, "latency": 81, "rem_sleep": 48, "restfulness": 80, "timing": 16, "total_sleep": 75}', '2025-03-09T00:00:00+00:00');
+    VALUES ('c0bc2af9-b891-4b3e-bd8d-5d09d3437b51', '2025-03-09', 69, '{"deep_sleep": 84, "efficiency": 76, "latency": 81, "rem_sleep": 48, "restfulness": 80, "timing": 16, "total_sleep": 75}', '2025-03-09T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('6a59e66f-2a45-4941-9596-474dec21a126', '2025-03-10', 71, '{"deep_sleep": 75, "efficiency": 97, "latency": 81, "rem_sleep": 44, "restfulness": 75, "timing": 36, "total_sleep": 76}', '2025-03-10T00:00:00+00:00');
+    VALUES ('6a59e66f-2a45-4941-9596-474dec21a126', '2025-03-10', 71, '{"deep_sleep": 75, "efficiency": 97, "latency": 81, "rem_sleep": 44, "restfulness": 75, "timing": 36, "total_sleep": 76}', '2025-03-10T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('9de26be9-9bde-4eec-bdfb-c5b65a8fdee2', '2025-03-11', 76, '{"deep_sleep": 83, "efficiency": 96, "latency": 94, "rem_sleep": 47, "restfulness": 80, "timing": 44, "total_sleep": 78}', '2025-03-11T00:00:00+00:00');
+    VALUES ('9de26be9-9bde-4eec-bdfb-c5b65a8fdee2', '2025-03-11', 76, '{"deep_sleep": 83, "efficiency": 96, "latency": 94, "rem_sleep": 47, "restfulness": 80, "timing": 44, "total_sleep": 78}', '2025-03-11T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('1603e0c2-c7a2-4fc1-9c11-7556b5dfd573', '2025-03-12', 87, '{"deep_sleep": 97, "efficiency": 88, "latency": 81, "rem_sleep": 67, "restfulness": 81, "timing": 72, "total_sleep": 97}', '2025-03-12T00:00:00+00:00');
+    VALUES ('1603e0c2-c7a2-4fc1-9c11-7556b5dfd573', '2025-03-12', 87, '{"deep_sleep": 97, "efficiency": 88, "latency": 81, "rem_sleep": 67, "restfulness": 81, "timing": 72, "total_sleep": 97}', '2025-03-12T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('9e9e40e7-2d43-4530-a825-e318e0aab1b5', '2025-03-13', 57, '{"deep_sleep": 48, "efficiency": 97, "latency": 83, "rem_sleep": 16, "restfulness": 84, "timing": 88, "total_sleep": 31}', '2025-03-13T00:00:00+00:00');
+    VALUES ('9e9e40e7-2d43-4530-a825-e318e0aab1b5', '2025-03-13', 57, '{"deep_sleep": 48, "efficiency": 97, "latency": 83, "rem_sleep": 16, "restfulness": 84, "timing": 88, "total_sleep": 31}', '2025-03-13T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('1dd06751-bb11-47e2-8dbe-957ca2966fc2', '2025-03-14', 76, '{"deep_sleep": 96, "efficiency": 93, "latency": 83, "rem_sleep": 73, "restfulness": 81, "timing": 19, "total_sleep": 79}', '2025-03-14T00:00:00+00:00');
+    VALUES ('1dd06751-bb11-47e2-8dbe-957ca2966fc2', '2025-03-14', 76, '{"deep_sleep": 96, "efficiency": 93, "latency": 83, "rem_sleep": 73, "restfulness": 81, "timing": 19, "total_sleep": 79}', '2025-03-14T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('16dde86a-f2b1-4616-8231-49e6602c6aa2', '2025-03-15', 81, '{"deep_sleep": 97, "efficiency": 90, "latency": 83, "rem_sleep": 54, "restfulness": 77, "timing": 48, "total_sleep": 91}', '2025-03-15T00:00:00+00:00');
+    VALUES ('16dde86a-f2b1-4616-8231-49e6602c6aa2', '2025-03-15', 81, '{"deep_sleep": 97, "efficiency": 90, "latency": 83, "rem_sleep": 54, "restfulness": 77, "timing": 48, "total_sleep": 91}', '2025-03-15T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('e0b4cdcd-6f02-4f27-8f31-01efcc74ca7a', '2025-03-16', 69, '{"deep_sleep": 97, "efficiency": 90, "latency": 91, "rem_sleep": 44, "restfulness": 91, "timing": 26, "total_sleep": 57}', '2025-03-16T00:00:00+00:00');
+    VALUES ('e0b4cdcd-6f02-4f27-8f31-01efcc74ca7a', '2025-03-16', 69, '{"deep_sleep": 97, "efficiency": 90, "latency": 91, "rem_sleep": 44, "restfulness": 91, "timing": 26, "total_sleep": 57}', '2025-03-16T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('21c75b03-8340-4031-b2ce-2a0f7f932a3d', '2025-03-17', 80, '{"deep_sleep": 96, "efficiency": 98, "latency": 94, "rem_sleep": 67, "restfulness": 82, "timing": 23, "total_sleep": 84}', '2025-03-17T00:00:00+00:00');
+    VALUES ('21c75b03-8340-4031-b2ce-2a0f7f932a3d', '2025-03-17', 80, '{"deep_sleep": 96, "efficiency": 98, "latency": 94, "rem_sleep": 67, "restfulness": 82, "timing": 23, "total_sleep": 84}', '2025-03-17T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('872bc30c-61cb-4e37-87a1-f38506da5c83', '2025-03-18', 80, '{"deep_sleep": 99, "efficiency": 90, "latency": 72, "rem_sleep": 46, "restfulness": 79, "timing": 81, "total_sleep": 84}', '2025-03-18T00:00:00+00:00');
+    VALUES ('872bc30c-61cb-4e37-87a1-f38506da5c83', '2025-03-18', 80, '{"deep_sleep": 99, "efficiency": 90, "latency": 72, "rem_sleep": 46, "restfulness": 79, "timing": 81, "total_sleep": 84}', '2025-03-18T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('fcfd13d4-4b6d-48a9-82db-89c3daa610fd', '2025-03-19', 86, '{"deep_sleep": 99, "efficiency": 90, "latency": 97, "rem_sleep": 70, "restfulness": 85, "timing": 57, "total_sleep": 91}', '2025-03-19T00:00:00+00:00');
+    VALUES ('fcfd13d4-4b6d-48a9-82db-89c3daa610fd', '2025-03-19', 86, '{"deep_sleep": 99, "efficiency": 90, "latency": 97, "rem_sleep": 70, "restfulness": 85, "timing": 57, "total_sleep": 91}', '2025-03-19T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('9efed157-69a2-45bc-b66a-fd4b571e8c62', '2025-03-20', 69, '{"deep_sleep": 95, "efficiency": 90, "latency": 64, "rem_sleep": 48, "restfulness": 86, "timing": 19, "total_sleep": 70}', '2025-03-20T00:00:00+00:00');
+    VALUES ('9efed157-69a2-45bc-b66a-fd4b571e8c62', '2025-03-20', 69, '{"deep_sleep": 95, "efficiency": 90, "latency": 64, "rem_sleep": 48, "restfulness": 86, "timing": 19, "total_sleep": 70}', '2025-03-20T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('9ada4627-6e79-45ba-9c76-e9698cd742df', '2025-03-21', 74, '{"deep_sleep": 92, "efficiency": 72, "latency": 94, "rem_sleep": 60, "restfulness": 84, "timing": 23, "total_sleep": 78}', '2025-03-21T00:00:00+00:00');
+    VALUES ('9ada4627-6e79-45ba-9c76-e9698cd742df', '2025-03-21', 74, '{"deep_sleep": 92, "efficiency": 72, "latency": 94, "rem_sleep": 60, "restfulness": 84, "timing": 23, "total_sleep": 78}', '2025-03-21T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('f43dd14d-3d14-4ac6-b29e-0321db254e5b', '2025-03-22', 62, '{"deep_sleep": 77, "efficiency": 72, "latency": 75, "rem_sleep": 65, "restfulness": 59, "timing": 1, "total_sleep": 70}', '2025-03-22T00:00:00+00:00');
+    VALUES ('f43dd14d-3d14-4ac6-b29e-0321db254e5b', '2025-03-22', 62, '{"deep_sleep": 77, "efficiency": 72, "latency": 75, "rem_sleep": 65, "restfulness": 59, "timing": 1, "total_sleep": 70}', '2025-03-22T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('399480b5-3034-48b1-a121-5b6a592145a5', '2025-03-23', 75, '{"deep_sleep": 96, "efficiency": 88, "latency": 86, "rem_sleep": 53, "restfulness": 91, "timing": 47, "total_sleep": 68}', '2025-03-23T00:00:00+00:00');
+    VALUES ('399480b5-3034-48b1-a121-5b6a592145a5', '2025-03-23', 75, '{"deep_sleep": 96, "efficiency": 88, "latency": 86, "rem_sleep": 53, "restfulness": 91, "timing": 47, "total_sleep": 68}', '2025-03-23T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('94a577b5-1263-4114-a229-5a973afafd3e', '2025-03-24', 78, '{"deep_sleep": 96, "efficiency": 86, "latency": 75, "rem_sleep": 50, "restfulness": 82, "timing": 38, "total_sleep": 88}', '2025-03-24T00:00:00+00:00');
+    VALUES ('94a577b5-1263-4114-a229-5a973afafd3e', '2025-03-24', 78, '{"deep_sleep": 96, "efficiency": 86, "latency": 75, "rem_sleep": 50, "restfulness": 82, "timing": 38, "total_sleep": 88}', '2025-03-24T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('8e4fa545-de86-409a-a6cb-e0186a1f8327', '2025-03-25', 80, '{"deep_sleep": 97, "efficiency": 95, "latency": 91, "rem_sleep": 62, "restfulness": 82, "timing": 21, "total_sleep": 90}', '2025-03-25T00:00:00+00:00');
+    VALUES ('8e4fa545-de86-409a-a6cb-e0186a1f8327', '2025-03-25', 80, '{"deep_sleep": 97, "efficiency": 95, "latency": 91, "rem_sleep": 62, "restfulness": 82, "timing": 21, "total_sleep": 90}', '2025-03-25T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('36a52f33-2f33-4afc-8447-a7e7fa5f717d', '2025-03-26', 63, '{"deep_sleep": 86, "efficiency": 60, "latency": 35, "rem_sleep": 65, "restfulness": 56, "timing": 23, "total_sleep": 80}', '2025-03-26T00:00:00+00:00');
+    VALUES ('36a52f33-2f33-4afc-8447-a7e7fa5f717d', '2025-03-26', 63, '{"deep_sleep": 86, "efficiency": 60, "latency": 35, "rem_sleep": 65, "restfulness": 56, "timing": 23, "total_sleep": 80}', '2025-03-26T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('f082ee1f-7df8-466d-87c3-1e2e719df949', '2025-03-27', 63, '{"deep_sleep": 82, "efficiency": 74, "latency": 89, "rem_sleep": 34, "restfulness": 82, "timing": 53, "total_sleep": 49}', '2025-03-27T00:00:00+00:00');
+    VALUES ('f082ee1f-7df8-466d-87c3-1e2e719df949', '2025-03-27', 63, '{"deep_sleep": 82, "efficiency": 74, "latency": 89, "rem_sleep": 34, "restfulness": 82, "timing": 53, "total_sleep": 49}', '2025-03-27T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('8c36ed38-6bc6-48eb-9efb-6147dfa90d95', '2025-03-28', 77, '{"deep_sleep": 90, "efficiency": 96, "latency": 70, "rem_sleep": 78, "restfulness": 72, "timing": 52, "total_sleep": 79}', '2025-03-28T00:00:00+00:00');
+    VALUES ('8c36ed38-6bc6-48eb-9efb-6147dfa90d95', '2025-03-28', 77, '{"deep_sleep": 90, "efficiency": 96, "latency": 70, "rem_sleep": 78, "restfulness": 72, "timing": 52, "total_sleep": 79}', '2025-03-28T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('730cd53f-00fb-40eb-aeda-f124b6b69715', '2025-03-29', 71, '{"deep_sleep": 80, "efficiency": 97, "latency": 94, "rem_sleep": 63, "restfulness": 87, "timing": 46, "total_sleep": 57}', '2025-03-29T00:00:00+00:00');
+    VALUES ('730cd53f-00fb-40eb-aeda-f124b6b69715', '2025-03-29', 71, '{"deep_sleep": 80, "efficiency": 97, "latency": 94, "rem_sleep": 63, "restfulness": 87, "timing": 46, "total_sleep": 57}', '2025-03-29T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('7ccf4aba-8cc8-4403-80a3-dfc833e776bb', '2025-03-30', 61, '{"deep_sleep": 73, "efficiency": 72, "latency": 94, "rem_sleep": 44, "restfulness": 50, "timing": 23, "total_sleep": 65}', '2025-03-30T00:00:00+00:00');
+    VALUES ('7ccf4aba-8cc8-4403-80a3-dfc833e776bb', '2025-03-30', 61, '{"deep_sleep": 73, "efficiency": 72, "latency": 94, "rem_sleep": 44, "restfulness": 50, "timing": 23, "total_sleep": 65}', '2025-03-30T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('57fa4452-3062-4d37-bf1b-91820d3ab514', '2025-03-31', 72, '{"deep_sleep": 85, "efficiency": 95, "latency": 70, "rem_sleep": 49, "restfulness": 84, "timing": 22, "total_sleep": 79}', '2025-03-31T00:00:00+00:00');
+    VALUES ('57fa4452-3062-4d37-bf1b-91820d3ab514', '2025-03-31', 72, '{"deep_sleep": 85, "efficiency": 95, "latency": 70, "rem_sleep": 49, "restfulness": 84, "timing": 22, "total_sleep": 79}', '2025-03-31T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('de922c06-f957-44df-92e6-773bbf5e9eef', '2025-04-01', 80, '{"deep_sleep": 91, "efficiency": 95, "latency": 91, "rem_sleep": 59, "restfulness": 75, "timing": 69, "total_sleep": 80}', '2025-04-01T00:00:00+00:00');
+    VALUES ('de922c06-f957-44df-92e6-773bbf5e9eef', '2025-04-01', 80, '{"deep_sleep": 91, "efficiency": 95, "latency": 91, "rem_sleep": 59, "restfulness": 75, "timing": 69, "total_sleep": 80}', '2025-04-01T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('3671987d-2232-4d4c-8ae2-44bea78a22df', '2025-04-02', 81, '{"deep_sleep": 85, "efficiency": 95, "latency": 89, "rem_sleep": 63, "restfulness": 73, "timing": 64, "total_sleep": 87}', '2025-04-02T00:00:00+00:00');
+    VALUES ('3671987d-2232-4d4c-8ae2-44bea78a22df', '2025-04-02', 81, '{"deep_sleep": 85, "efficiency": 95, "latency": 89, "rem_sleep": 63, "restfulness": 73, "timing": 64, "total_sleep": 87}', '2025-04-02T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('642cae4b-689c-4fbf-bdfc-8eef1470f07b', '2025-04-03', 86, '{"deep_sleep": 73, "efficiency": 97, "latency": 86, "rem_sleep": 95, "restfulness": 81, "timing": 78, "total_sleep": 89}', '2025-04-03T00:00:00+00:00');
+    VALUES ('642cae4b-689c-4fbf-bdfc-8eef1470f07b', '2025-04-03', 86, '{"deep_sleep": 73, "efficiency": 97, "latency": 86, "rem_sleep": 95, "restfulness": 81, "timing": 78, "total_sleep": 89}', '2025-04-03T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
     INSERT INTO public.oura_sleep (original_id, day, score, contributors, timestamp)
-    VALUES ('939062a2-dcf8-4cb6-bf1d-bc9e17a205d7', '2025-04-04', 78, '{"deep_sleep": 95, "efficiency": 100, "latency": 72, "rem_sleep": 72, "restfulness": 72, "timing": 75, "total_sleep": 74}', '2025-04-04T00:00:00+00:00');
+    VALUES ('939062a2-dcf8-4cb6-bf1d-bc9e17a205d7', '2025-04-04', 78, '{"deep_sleep": 95, "efficiency": 100, "latency": 72, "rem_sleep": 72, "restfulness": 72, "timing": 75, "total_sleep": 74}', '2025-04-04T00:00:00+00:00')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, score = EXCLUDED.score, contributors = EXCLUDED.contributors, timestamp = EXCLUDED.timestamp, updated_at = NOW();
     
\ No newline at end of file
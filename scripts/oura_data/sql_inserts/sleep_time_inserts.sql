@@ -1,67 +1,89 @@
 
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('f513bd38-063e-48ac-bc40-adeca1b24305', '2025-03-06', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('f513bd38-063e-48ac-bc40-adeca1b24305', '2025-03-06', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('7616658f-03fa-4b1b-a5ba-2ea9c97eb9a8', '2025-03-08', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('7616658f-03fa-4b1b-a5ba-2ea9c97eb9a8', '2025-03-08', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('4d530375-f1ae-4a63-b82d-30f5db66262a', '2025-03-12', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('4d530375-f1ae-4a63-b82d-30f5db66262a', '2025-03-12', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('2fd86abb-2524-4b39-943b-84534ecbdc03', '2025-03-13', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('2fd86abb-2524-4b39-943b-84534ecbdc03', '2025-03-13', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('3e29e745-021a-411a-9b43-bb1bcd71ce92', '2025-03-15', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('3e29e745-021a-411a-9b43-bb1bcd71ce92', '2025-03-15', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('699897e8-1d42-4fb5-9112-7cd6d1d8952e', '2025-03-16', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('699897e8-1d42-4fb5-9112-7cd6d1d8952e', '2025-03-16', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('c50ac788-207a-40df-afe2-a11b288e5b02', '2025-03-17', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('c50ac788-207a-40df-afe2-a11b288e5b02', '2025-03-17', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('bcf943e6-39d4-4bc6-ad7c-d63bd80d322b', '2025-03-18', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('bcf943e6-39d4-4bc6-ad7c-d63bd80d322b', '2025-03-18', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('bd7e61b3-b650-406c-96ce-92856d0b78de', '2025-03-19', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('bd7e61b3-b650-406c-96ce-92856d0b78de', '2025-03-19', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('b4fbaff0-0691-4793-918d-15b58e4aec87', '2025-03-21', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('b4fbaff0-0691-4793-918d-15b58e4aec87', '2025-03-21', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('adc6756a-1bac-4f93-8522-2612cb4c3c74', '2025-03-22', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('adc6756a-1bac-4f93-8522-2612cb4c3c74', '2025-03-22', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('9d4e477e-7d69-4d1b-ad95-9a56cf0f1562', '2025-03-23', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('9d4e477e-7d69-4d1b-ad95-9a56cf0f1562', '2025-03-23', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('9b0303b0-9ba8-4105-9570-f61e7b93737d', '2025-03-24', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('9b0303b0-9ba8-4105-9570-f61e7b93737d', '2025-03-24', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('c0c2c233-6334-4636-b67d-7bf3cf718a8e', '2025-03-25', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('c0c2c233-6334-4636-b67d-7bf3cf718a8e', '2025-03-25', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('7acd0f40-e089-488c-bcd3-739316446f94', '2025-03-26', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('7acd0f40-e089-488c-bcd3-739316446f94', '2025-03-26', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('80e8d73b-3b9c-49ea-ac5e-a0f444ff0793', '2025-03-27', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('80e8d73b-3b9c-49ea-ac5e-a0f444ff0793', '2025-03-27', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('dceda840-bf5d-4a03-8526-0ec9be16e2ff', '2025-03-28', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('dceda840-bf5d-4a03-8526-0ec9be16e2ff', '2025-03-28', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('0ef216e6-c800-470f-9001-c33019fa0b03', '2025-03-29', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('0ef216e6-c800-470f-9001-c33019fa0b03', '2025-03-29', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('c6c8a053-e9f6-4f21-9550-f488a0bf2a46', '2025-03-30', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('c6c8a053-e9f6-4f21-9550-f488a0bf2a46', '2025-03-30', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('3c026db7-4852-4569-8ac6-f845d2e33df4', '2025-03-31', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('3c026db7-4852-4569-8ac6-f845d2e33df4', '2025-03-31', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('4cd529c2-fafe-406b-a5b9-9bb75495d007', '2025-04-01', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('4cd529c2-fafe-406b-a5b9-9bb75495d007', '2025-04-01', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
-    INSERT INTO public.oura_sleep_time (original_id, day, bedtime_start, bedtime_end, duration)
-    VALUES ('20063477-5868-4541-9100-4f9195bd8426', '2025-04-02', '', 'earlier_bedtime', only_recommended_found);
+    INSERT INTO public.oura_sleep_time (original_id, day, optimal_bedtime, recommendation, status)
+    VALUES ('20063477-5868-4541-9100-4f9195bd8426', '2025-04-02', NULL, 'earlier_bedtime', 'only_recommended_found')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, optimal_bedtime = EXCLUDED.optimal_bedtime, recommendation = EXCLUDED.recommendation, status = EXCLUDED.status, updated_at = NOW();
     
\ No newline at end of file
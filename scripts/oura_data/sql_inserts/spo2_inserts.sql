@@ -1,136 +1,181 @@
 
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('a3965a6a-b00c-4814-8376-67f76ce55f72', '2025-03-05', '{"average": 97.029}', 2.0);
+    VALUES ('a3965a6a-b00c-4814-8376-67f76ce55f72', '2025-03-05', '{"average": 97.029}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('ae8ceffa-0ec1-479a-8caa-78c9bc1e1721', '2025-03-05', '{"average": 97.029}', 2.0);
+    VALUES ('ae8ceffa-0ec1-479a-8caa-78c9bc1e1721', '2025-03-05', '{"average": 97.029}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('8c4c9367-8bc4-4c23-9f07-79d33729f3ae', '2025-03-06', '{"average": 96.934}', 2.0);
+    VALUES ('8c4c9367-8bc4-4c23-9f07-79d33729f3ae', '2025-03-06', '{"average": 96.934}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('180aa949-fe73-4594-a102-fd58aa9bb74e', '2025-03-06', '{"average": 96.934}', 2.0);
+    VALUES ('180aa949-fe73-4594-a102-fd58aa9bb74e', '2025-03-06', '{"average": 96.934}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('64bd2c01-5dcc-4a41-a2e8-18eda5ee5f5a', '2025-03-07', '{"average": 96.708}', 3.0);
+    VALUES ('64bd2c01-5dcc-4a41-a2e8-18eda5ee5f5a', '2025-03-07', '{"average": 96.708}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('f2f513c5-2a1f-4915-8203-d15fa43691ae', '2025-03-07', '{"average": 96.714}', 2.0);
+    VALUES ('f2f513c5-2a1f-4915-8203-d15fa43691ae', '2025-03-07', '{"average": 96.714}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('86e482a5-4229-4993-9b27-3d0558d6c0a9', '2025-03-08', '{"average": 96.376}', 0.0);
+    VALUES ('86e482a5-4229-4993-9b27-3d0558d6c0a9', '2025-03-08', '{"average": 96.376}', 0.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('153503a7-84c7-4f04-8ea0-106e9ef534cb', '2025-03-08', '{"average": 96.376}', 0.0);
+    VALUES ('153503a7-84c7-4f04-8ea0-106e9ef534cb', '2025-03-08', '{"average": 96.376}', 0.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('23bb38a1-0114-40c0-818e-ecd6121f20e7', '2025-03-09', '{"average": 96.959}', 3.0);
+    VALUES ('23bb38a1-0114-40c0-818e-ecd6121f20e7', '2025-03-09', '{"average": 96.959}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('c3e304a2-83a0-41b4-b793-5ba774b6a3ae', '2025-03-09', '{"average": 96.928}', 3.0);
+    VALUES ('c3e304a2-83a0-41b4-b793-5ba774b6a3ae', '2025-03-09', '{"average": 96.928}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('333e4ab7-41fa-4c2a-a4cd-d87f99d14474', '2025-03-10', '{"average": 93.91}', 6.0);
+    VALUES ('333e4ab7-41fa-4c2a-a4cd-d87f99d14474', '2025-03-10', '{"average": 93.91}', 6.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('7b5af703-c9fa-45f1-beab-bc3a5f86a437', '2025-03-10', '{"average": 93.91}', 6.0);
+    VALUES ('7b5af703-c9fa-45f1-beab-bc3a5f86a437', '2025-03-10', '{"average": 93.91}', 6.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('f535f1f3-ec72-4c35-a8c0-f24b55ce855d', '2025-03-11', '{"average": 96.917}', 2.0);
+    VALUES ('f535f1f3-ec72-4c35-a8c0-f24b55ce855d', '2025-03-11', '{"average": 96.917}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('ab15af7b-9f2d-42cf-8764-8ced12688b80', '2025-03-11', '{"average": 96.917}', 2.0);
+    VALUES ('ab15af7b-9f2d-42cf-8764-8ced12688b80', '2025-03-11', '{"average": 96.917}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('638fc814-c74a-4fe8-81a1-6003b99bc629', '2025-03-12', '{"average": 96.89}', 1.0);
+    VALUES ('638fc814-c74a-4fe8-81a1-6003b99bc629', '2025-03-12', '{"average": 96.89}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('111fa202-5aa8-4c9c-a89e-bb53a04dba1f', '2025-03-12', '{"average": 96.89}', 1.0);
+    VALUES ('111fa202-5aa8-4c9c-a89e-bb53a04dba1f', '2025-03-12', '{"average": 96.89}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('da25785e-bead-439a-9698-8451e68dd447', '2025-03-13', NULL, NULL);
+    VALUES ('da25785e-bead-439a-9698-8451e68dd447', '2025-03-13', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('10f2bb91-82fc-4627-bd1a-3dfbd860d12d', '2025-03-13', NULL, NULL);
+    VALUES ('10f2bb91-82fc-4627-bd1a-3dfbd860d12d', '2025-03-13', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('f20f06a7-926f-4761-81ce-49f90f181094', '2025-03-14', '{"average": 96.691}', 3.0);
+    VALUES ('f20f06a7-926f-4761-81ce-49f90f181094', '2025-03-14', '{"average": 96.691}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('79e2adca-23ef-4719-a340-3a8cb94d6065', '2025-03-14', '{"average": 96.691}', 3.0);
+    VALUES ('79e2adca-23ef-4719-a340-3a8cb94d6065', '2025-03-14', '{"average": 96.691}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('7d801734-206f-486c-b3c6-2a6fa818f834', '2025-03-15', '{"average": 96.755}', 1.0);
+    VALUES ('7d801734-206f-486c-b3c6-2a6fa818f834', '2025-03-15', '{"average": 96.755}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('2891c904-2f6f-417a-aab7-fb11d4a970b9', '2025-03-16', '{"average": 97.018}', 2.0);
+    VALUES ('2891c904-2f6f-417a-aab7-fb11d4a970b9', '2025-03-16', '{"average": 97.018}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('82336499-fbd6-4997-a900-b62f1da43b8b', '2025-03-17', '{"average": 97.177}', 0.0);
+    VALUES ('82336499-fbd6-4997-a900-b62f1da43b8b', '2025-03-17', '{"average": 97.177}', 0.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('82ddba9b-b8d2-4402-af7d-ce99f035eed6', '2025-03-18', NULL, NULL);
+    VALUES ('82ddba9b-b8d2-4402-af7d-ce99f035eed6', '2025-03-18', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('79ca4f9d-2fe7-4dad-b59a-a0a9f2fe25bd', '2025-03-18', NULL, NULL);
+    VALUES ('79ca4f9d-2fe7-4dad-b59a-a0a9f2fe25bd', '2025-03-18', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('aa2ec498-a292-4fe8-872f-2a1874228b6f', '2025-03-19', '{"average": 97.258}', 2.0);
+    VALUES ('aa2ec498-a292-4fe8-872f-2a1874228b6f', '2025-03-19', '{"average": 97.258}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('65b07768-114f-4832-841b-f3241605d169', '2025-03-20', '{"average": 96.874}', 0.0);
+    VALUES ('65b07768-114f-4832-841b-f3241605d169', '2025-03-20', '{"average": 96.874}', 0.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('ee9c3437-32d3-4fac-8897-3204111346f9', '2025-03-20', '{"average": 96.874}', 0.0);
+    VALUES ('ee9c3437-32d3-4fac-8897-3204111346f9', '2025-03-20', '{"average": 96.874}', 0.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('88d0eccb-b5bf-4c5c-9a70-96d46e7d817f', '2025-03-21', '{"average": 96.733}', 1.0);
+    VALUES ('88d0eccb-b5bf-4c5c-9a70-96d46e7d817f', '2025-03-21', '{"average": 96.733}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('c1bf03bb-4162-4747-a910-468f8648c464', '2025-03-22', NULL, NULL);
+    VALUES ('c1bf03bb-4162-4747-a910-468f8648c464', '2025-03-22', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('a0e0738a-eade-40b8-afb8-7ec571ac703e', '2025-03-22', NULL, NULL);
+    VALUES ('a0e0738a-eade-40b8-afb8-7ec571ac703e', '2025-03-22', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('b2dcf233-7a1c-4447-ac29-f9c20d7e4d55', '2025-03-23', '{"average": 96.879}', 1.0);
+    VALUES ('b2dcf233-7a1c-4447-ac29-f9c20d7e4d55', '2025-03-23', '{"average": 96.879}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('d4c3dfc5-afc5-45dc-a4af-dab1eb0aeb5e', '2025-03-24', '{"average": 97.396}', 1.0);
+    VALUES ('d4c3dfc5-afc5-45dc-a4af-dab1eb0aeb5e', '2025-03-24', '{"average": 97.396}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('cdd9411a-fb2f-46db-8533-1a871005686b', '2025-03-25', '{"average": 97.502}', 1.0);
+    VALUES ('cdd9411a-fb2f-46db-8533-1a871005686b', '2025-03-25', '{"average": 97.502}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('301f0f5c-a750-4c49-8c23-b45c4445a850', '2025-03-26', '{"average": 96.934}', 1.0);
+    VALUES ('301f0f5c-a750-4c49-8c23-b45c4445a850', '2025-03-26', '{"average": 96.934}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('a4701d4e-d39c-4517-b77e-a5391cb3e83e', '2025-03-27', '{"average": 97.137}', 1.0);
+    VALUES ('a4701d4e-d39c-4517-b77e-a5391cb3e83e', '2025-03-27', '{"average": 97.137}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('3de2e38c-d261-4ae5-a974-d00bbd51be8e', '2025-03-28', '{"average": 97.346}', 2.0);
+    VALUES ('3de2e38c-d261-4ae5-a974-d00bbd51be8e', '2025-03-28', '{"average": 97.346}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('0ccf126b-92f1-4aa5-b5dd-a3892e80c245', '2025-03-29', '{"average": 97.237}', 2.0);
+    VALUES ('0ccf126b-92f1-4aa5-b5dd-a3892e80c245', '2025-03-29', '{"average": 97.237}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('261209bd-12d7-4dff-a566-9a73af3e06be', '2025-03-30', '{"average": 96.895}', 2.0);
+    VALUES ('261209bd-12d7-4dff-a566-9a73af3e06be', '2025-03-30', '{"average": 96.895}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('22f8d3a2-d4b7-4bdf-8d43-3e03668e824f', '2025-03-31', '{"average": 97.643}', 3.0);
+    VALUES ('22f8d3a2-d4b7-4bdf-8d43-3e03668e824f', '2025-03-31', '{"average": 97.643}', 3.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('5e5b40e9-a697-4242-a779-45e276b71579', '2025-04-01', '{"average": 97.202}', 1.0);
+    VALUES ('5e5b40e9-a697-4242-a779-45e276b71579', '2025-04-01', '{"average": 97.202}', 1.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('22e3ac86-2924-457e-a403-8d5d5f84f4d7', '2025-04-02', NULL, NULL);
+    VALUES ('22e3ac86-2924-457e-a403-8d5d5f84f4d7', '2025-04-02', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('996385f1-89bb-4645-baae-58a992cfef23', '2025-04-02', NULL, NULL);
+    VALUES ('996385f1-89bb-4645-baae-58a992cfef23', '2025-04-02', NULL, NULL)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('287c75a8-0c57-479a-b7d9-6ec5a1dc4161', '2025-04-03', '{"average": 97.008}', 2.0);
+    VALUES ('287c75a8-0c57-479a-b7d9-6ec5a1dc4161', '2025-04-03', '{"average": 97.008}', 2.0)
+    ON CONFLICT DO NOTHING;
     
     INSERT INTO public.oura_spo2 (original_id, day, spo2_percentage, breathing_disturbance_index)
-    VALUES ('1b04e37b-15b4-45c2-8f48-c647ad83bd67', '2025-04-04', '{"average": 97.168}', 2.0);
+    VALUES ('1b04e37b-15b4-45c2-8f48-c647ad83bd67', '2025-04-04', '{"average": 97.168}', 2.0)
+    ON CONFLICT DO NOTHING;
     
\ No newline at end of file
@@ -1,94 +1,125 @@
 
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('3d976357-3715-4051-a4c0-77fc3e466bb5', '2025-03-05', 2700, 12600, 'restored');
+    VALUES ('3d976357-3715-4051-a4c0-77fc3e466bb5', '2025-03-05', 2700, 12600, 'restored')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('68fe24af-edc8-45a4-b4d4-51d7263e7127', '2025-03-06', 18900, 2700, 'stressful');
+    VALUES ('68fe24af-edc8-45a4-b4d4-51d7263e7127', '2025-03-06', 18900, 2700, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('36f02cad-fa02-498d-85a6-9a0aa9ac3219', '2025-03-07', 3600, 5400, 'normal');
+    VALUES ('36f02cad-fa02-498d-85a6-9a0aa9ac3219', '2025-03-07', 3600, 5400, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('dbd81cfd-32ce-4d94-b328-dffa159b14be', '2025-03-08', 18000, 2700, 'stressful');
+    VALUES ('dbd81cfd-32ce-4d94-b328-dffa159b14be', '2025-03-08', 18000, 2700, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('47cddb52-eeb0-4485-9385-98586f41c2d8', '2025-03-09', 8100, 900, 'normal');
+    VALUES ('47cddb52-eeb0-4485-9385-98586f41c2d8', '2025-03-09', 8100, 900, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('7ebabf4f-edca-48fa-bb63-d797458ac287', '2025-03-10', 10800, 15300, 'restored');
+    VALUES ('7ebabf4f-edca-48fa-bb63-d797458ac287', '2025-03-10', 10800, 15300, 'restored')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('a03c6360-43a7-4221-9873-3603f310dd1d', '2025-03-11', 5400, 5400, 'normal');
+    VALUES ('a03c6360-43a7-4221-9873-3603f310dd1d', '2025-03-11', 5400, 5400, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('5bb0ecee-b8fa-4308-a522-9a6c87dd66c6', '2025-03-12', 27000, 900, 'stressful');
+    VALUES ('5bb0ecee-b8fa-4308-a522-9a6c87dd66c6', '2025-03-12', 27000, 900, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('144a5348-2dce-443d-9a65-f37c11006100', '2025-03-13', 12600, 2700, 'stressful');
+    VALUES ('144a5348-2dce-443d-9a65-f37c11006100', '2025-03-13', 12600, 2700, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('86b86bb5-fff6-4c75-92ab-e185ee03e3b5', '2025-03-14', 6300, 8100, 'normal');
+    VALUES ('86b86bb5-fff6-4c75-92ab-e185ee03e3b5', '2025-03-14', 6300, 8100, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('b03ff364-1bf0-4b76-abeb-b887ef4e5419', '2025-03-15', 2700, 17100, 'restored');
+    VALUES ('b03ff364-1bf0-4b76-abeb-b887ef4e5419', '2025-03-15', 2700, 17100, 'restored')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('484a37ae-0f00-44bb-95ab-b82b47ece6fc', '2025-03-16', 22500, 7200, 'stressful');
+    VALUES ('484a37ae-0f00-44bb-95ab-b82b47ece6fc', '2025-03-16', 22500, 7200, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('bc55c3f2-9f72-4182-bd69-14cc5f7e5fc9', '2025-03-17', 14400, 900, 'stressful');
+    VALUES ('bc55c3f2-9f72-4182-bd69-14cc5f7e5fc9', '2025-03-17', 14400, 900, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('355b30b6-c1b9-45e7-aead-feab8a9b4eb3', '2025-03-18', 11700, 3600, 'normal');
+    VALUES ('355b30b6-c1b9-45e7-aead-feab8a9b4eb3', '2025-03-18', 11700, 3600, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('75e9f377-63d8-4d69-a99f-5114be1ae52c', '2025-03-19', 5400, 9900, 'normal');
+    VALUES ('75e9f377-63d8-4d69-a99f-5114be1ae52c', '2025-03-19', 5400, 9900, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('0bbc55ca-9b18-4c0a-95fa-e4159ec36f7f', '2025-03-20', 23400, 2700, 'stressful');
+    VALUES ('0bbc55ca-9b18-4c0a-95fa-e4159ec36f7f', '2025-03-20', 23400, 2700, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('317d70e5-2b25-47b1-bf4a-40976f76f0a7', '2025-03-21', 20700, 900, 'stressful');
+    VALUES ('317d70e5-2b25-47b1-bf4a-40976f76f0a7', '2025-03-21', 20700, 900, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('82b38847-578f-4554-b299-e8791ab12c66', '2025-03-22', 20700, 2700, 'stressful');
+    VALUES ('82b38847-578f-4554-b299-e8791ab12c66', '2025-03-22', 20700, 2700, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('e31c8c8f-077b-4c7c-b5bc-968ed29c7170', '2025-03-23', 11700, 3600, 'stressful');
+    VALUES ('e31c8c8f-077b-4c7c-b5bc-968ed29c7170', '2025-03-23', 11700, 3600, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('91b4bc36-98f3-426c-a6ce-4bf09b2e952a', '2025-03-24', 22500, 0, 'stressful');
+    VALUES ('91b4bc36-98f3-426c-a6ce-4bf09b2e952a', '2025-03-24', 22500, 0, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('1a4e5fda-ef4f-458f-a896-bc531481819e', '2025-03-25', 13500, 3600, 'stressful');
+    VALUES ('1a4e5fda-ef4f-458f-a896-bc531481819e', '2025-03-25', 13500, 3600, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('f96db0d7-af3e-4cb1-b45d-a735fc2888bd', '2025-03-26', 4500, 900, 'normal');
+    VALUES ('f96db0d7-af3e-4cb1-b45d-a735fc2888bd', '2025-03-26', 4500, 900, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('32419968-75c8-43cf-ab2e-7a041f52a759', '2025-03-27', 10800, 6300, 'normal');
+    VALUES ('32419968-75c8-43cf-ab2e-7a041f52a759', '2025-03-27', 10800, 6300, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('c26be2d2-fb3a-4a9a-8343-e487850b10d0', '2025-03-28', 6300, 11700, 'normal');
+    VALUES ('c26be2d2-fb3a-4a9a-8343-e487850b10d0', '2025-03-28', 6300, 11700, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('1df16ed7-5002-4e33-83f0-bc99f34884a8', '2025-03-29', 16200, 3600, 'stressful');
+    VALUES ('1df16ed7-5002-4e33-83f0-bc99f34884a8', '2025-03-29', 16200, 3600, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('3eb116c3-e971-47f5-9fad-56d4e9a8030d', '2025-03-30', 5400, 7200, 'normal');
+    VALUES ('3eb116c3-e971-47f5-9fad-56d4e9a8030d', '2025-03-30', 5400, 7200, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('f5d3db02-4f2a-4881-a234-45e9a7599fdb', '2025-03-31', 26100, 5400, 'stressful');
+    VALUES ('f5d3db02-4f2a-4881-a234-45e9a7599fdb', '2025-03-31', 26100, 5400, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('b931d5ab-22d9-48fd-9c75-19598151f308', '2025-04-01', 11700, 4500, 'stressful');
+    VALUES ('b931d5ab-22d9-48fd-9c75-19598151f308', '2025-04-01', 11700, 4500, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('1f70eb55-df4b-438a-b809-6b576185d2c1', '2025-04-02', 900, 8100, 'normal');
+    VALUES ('1f70eb55-df4b-438a-b809-6b576185d2c1', '2025-04-02', 900, 8100, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('8484cd0c-398a-4e7a-aebe-ce47bedcfc80', '2025-04-03', 24300, 4500, 'stressful');
+    VALUES ('8484cd0c-398a-4e7a-aebe-ce47bedcfc80', '2025-04-03', 24300, 4500, 'stressful')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
     INSERT INTO public.oura_stress (original_id, day, stress_high, recovery_high, day_summary)
-    VALUES ('c0406350-8121-4611-b273-4c7a4da6b9e6', '2025-04-04', 4500, 1800, 'normal');
+    VALUES ('c0406350-8121-4611-b273-4c7a4da6b9e6', '2025-04-04', 4500, 1800, 'normal')
+    ON CONFLICT (day) DO UPDATE SET original_id = EXCLUDED.original_id, stress_high = EXCLUDED.stress_high, recovery_high = EXCLUDED.recovery_high, day_summary = EXCLUDED.day_summary, updated_at = NOW();
     
\ No newline at end of file
@@ -0,0 +1,357 @@
+# -------------------------------------------------------
+#  Oura Sync Daemon
+# -------------------------------------------------------
+#   Long-running alternative to running fetch + prepare + load
+#   from cron (python oura.py serve):
+#     1. Pulls each data type on its own schedule
+#        (sync_interval in data_types.py)
+#     2. Keeps the Oura client, the database connection and the
+#        keys of recently pushed rows in memory between pulls
+#     3. Validates each pull and pushes only rows it hasn't
+#        pushed before (or, for daily summaries, that changed)
+#     4. Serves throughput, lag and error counters as JSON on
+#        http://127.0.0.1:<port>/metrics
+# -------------------------------------------------------
+
+import io
+import json
+import os
+import signal
+import threading
+import time
+import traceback
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from data_types import SQL_OUTPUT_DIR, quarantine_path, select_data_types, sql_path
+from fetch_oura_data import fetch_oura_data, get_oura_client
+from prepare_data import build_insert_statements
+from validate_data import SchemaDriftError, coerce_frame, validate_frame
+
+# After a failed pull, try again after this many seconds (or the type's interval, if shorter)
+RETRY_DELAY = 5 * 60
+
+DEFAULT_METRICS_PORT = 8787
+
+
+def sync_window(entry):
+    """
+    Start of the window each pull covers: local midnight, sync_lookback_days ago.
+    The same value bounds the fetch and the startup seed query, so they cover the same rows.
+    """
+    today = datetime.now().astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=entry["sync_lookback_days"])
+
+
+def database_text(value):
+    """Turn a value read from the database back into the text a fetched CSV would hold."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def row_fingerprints(entry, clean):
+    """
+    Map each row's sync_key to a hash of the whole validated row. JSON columns are hashed
+    with sorted keys, since JSONB read back from the database doesn't keep the key order.
+    """
+    json_columns = [c for c, _, kind, _ in entry["columns"] if kind == "json" and c in clean.columns]
+    canonical = clean.assign(**{
+        c: clean[c].map(lambda text: json.dumps(json.loads(text), sort_keys=True), na_action="ignore")
+        for c in json_columns
+    })
+    fingerprints = pd.util.hash_pandas_object(canonical, index=False)
+    return {key: fp for key, fp in zip(clean[entry["sync_key"]], fingerprints) if not pd.isna(key)}
+
+
+def records_to_frame(records):
+    """
+    Turn the records returned by the Oura client into the same all-text
+    DataFrame that validate_csv reads from a fetched CSV file.
+    """
+    buffer = io.StringIO()
+    pd.DataFrame(records).to_csv(buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype=str, keep_default_na=False)
+
+
+class SyncMetrics:
+    """Thread-safe counters shared between the sync loop and the metrics endpoint."""
+
+    def __init__(self, names):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.types = {
+            name: {
+                "runs": 0,
+                "errors": 0,
+                "rows_fetched": 0,
+                "rows_rejected": 0,
+                "rows_pushed": 0,
+                "last_run": None,
+                "last_success": None,
+                "last_duration_seconds": None,
+                "last_error": None,
+                "newest_row": None,
+                "next_run": None,
+            }
+            for name in names
+        }
+
+    def update(self, name, **values):
+        with self.lock:
+            self.types[name].update(values)
+
+    def increment(self, name, **counts):
+        with self.lock:
+            for key, count in counts.items():
+                self.types[name][key] += count
+
+    def snapshot(self):
+        """Return all counters plus derived throughput and lag, ready for JSON."""
+        now = time.time()
+        with self.lock:
+            uptime = now - self.started
+            types = {}
+            for name, counters in self.types.items():
+                stats = dict(counters)
+                # Lag: how far behind real time the newest row we have pushed is
+                stats["lag_seconds"] = round(now - stats["newest_row"], 1) if stats["newest_row"] else None
+                next_run = stats.pop("next_run")
+                stats["next_run_in_seconds"] = round(max(0, next_run - now), 1) if next_run else None
+                for key in ("last_run", "last_success", "newest_row"):
+                    if stats[key] is not None:
+                        stats[key] = datetime.fromtimestamp(stats[key], timezone.utc).isoformat()
+                types[name] = stats
+
+        rows_pushed = sum(stats["rows_pushed"] for stats in types.values())
+        return {
+            "uptime_seconds": round(uptime, 1),
+            "rows_pushed": rows_pushed,
+            "rows_pushed_per_minute": round(rows_pushed / uptime * 60, 2) if uptime else 0,
+            "errors": sum(stats["errors"] for stats in types.values()),
+            "types": types,
+        }
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves SyncMetrics.snapshot() as JSON on /metrics."""
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404, "Try /metrics")
+            return
+
+        body = json.dumps(self.server.metrics.snapshot(), indent=2).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep the daemon output to sync progress only
+        pass
+
+
+class SyncDaemon:
+    """Pulls, validates and pushes Oura data on a schedule until stopped."""
+
+    def __init__(self, data_types=None, database_url=None, sql_only=False):
+        self.data_types = select_data_types(data_types)
+        self.database_url = database_url
+        self.sql_only = sql_only
+        self.metrics = SyncMetrics([name for name, _ in self.data_types])
+        self.stop_event = threading.Event()
+
+        # Kept warm between pulls
+        self.client = None
+        self.conn = None
+        # Per data type, key (see sync_key in data_types.py) -> fingerprint of each row already pushed
+        self.seen = {name: {} for name, _ in self.data_types}
+
+    def get_client(self):
+        if self.client is None:
+            self.client = get_oura_client()
+        return self.client
+
+    def get_connection(self):
+        # Reconnect if the previous connection was dropped
+        if self.conn is None or self.conn.closed:
+            from load_data import get_connection
+
+            self.conn = get_connection(self.database_url)
+        return self.conn
+
+    def seed_seen(self):
+        """
+        Load the rows already in the database for each sync window, so a restart doesn't push
+        them again. They are fingerprinted like a pull, so only rows that changed are re-pushed.
+        A type whose table can't be read starts with nothing seen and counts an error.
+        """
+        for name, entry in self.data_types:
+            columns = [table_column for table_column, _, _, _ in entry["columns"]]
+            date_column = "timestamp" if entry["sync_key"] == "timestamp" else "day"
+            since = sync_window(entry)
+            try:
+                conn = self.get_connection()
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"SELECT {', '.join(columns)} FROM public.{entry['table']} WHERE {date_column} >= %s",
+                        (since if date_column == "timestamp" else since.date(),),
+                    )
+                    rows = cur.fetchall()
+                conn.commit()
+            except Exception as e:
+                if self.conn is not None and not self.conn.closed:
+                    self.conn.rollback()
+                print(f"  {entry['label']}: ERROR reading {entry['table']}: {e}")
+                self.metrics.increment(name, errors=1)
+                self.metrics.update(name, last_error=f"reading {entry['table']}: {e}")
+                continue
+
+            stored = pd.DataFrame(rows, columns=columns, dtype=object).map(database_text)
+            self.seen[name] = row_fingerprints(entry, coerce_frame(name, stored))
+            print(f"  {entry['label']}: {len(self.seen[name])} recent rows already in {entry['table']}")
+
+    def push(self, entry, new_rows):
+        """Send INSERT statements for new_rows to the database (or append them to the SQL file)."""
+        statements = build_insert_statements(entry, new_rows)
+        if not statements:
+            return
+
+        if self.sql_only:
+            os.makedirs(SQL_OUTPUT_DIR, exist_ok=True)
+            with open(sql_path(entry), 'a') as f_out:
+                f_out.writelines(statements)
+            return
+
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("".join(statements))
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+
+    def rows_to_push(self, name, entry, clean):
+        """
+        Rows of a validated pull that haven't been pushed yet, plus the key -> fingerprint map for the pull.
+        Tables with a conflict_key (daily summaries) also get rows that changed since they were
+        pushed, e.g. today's score, since their inserts update the existing row.
+        """
+        pulled = row_fingerprints(entry, clean)
+        keys = clean[entry["sync_key"]]
+        # Kept as object so the uint64 fingerprints aren't cast to float next to missing ones
+        previous = pd.Series([self.seen[name].get(key) for key in keys], index=clean.index, dtype=object)
+        current = pd.Series([pulled.get(key) for key in keys], index=clean.index, dtype=object)
+
+        push = previous.isna()
+        if entry.get("conflict_key"):
+            push |= previous != current
+        return clean[push], pulled
+
+    def sync_type(self, name, entry):
+        """Run one pull for a data type. Returns the number of seconds until the next pull."""
+        started = time.time()
+        self.metrics.update(name, last_run=started)
+        self.metrics.increment(name, runs=1)
+
+        since = sync_window(entry)
+        if "date_params" in entry:
+            # Datetime endpoints (heart rate) get the exact window start
+            start, end = since.isoformat(), datetime.now().astimezone().isoformat()
+        else:
+            start, end = since.strftime('%Y-%m-%d'), (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        try:
+            records = fetch_oura_data(name, start, end, client=self.get_client())
+            if records is None:
+                raise RuntimeError(f"could not fetch {entry['label']} data (see error above)")
+            if not records:
+                print(f"[{name}] no data returned")
+                self.metrics.update(name, last_success=time.time(), last_duration_seconds=round(time.time() - started, 3))
+                return entry["sync_interval"]
+
+            # Each pull gets its own quarantine file, so rejects from earlier pulls (or prepare) are kept
+            clean, rejected_count = validate_frame(
+                name, records_to_frame(records), quarantine_file=quarantine_path(name, datetime.now()),
+            )
+            new_rows, pulled = self.rows_to_push(name, entry, clean)
+
+            self.push(entry, new_rows)
+
+            # The next pull covers the same window, so the rows from this pull are all we need to remember
+            self.seen[name] = pulled
+
+            time_column = "timestamp" if "timestamp" in clean.columns else "day"
+            newest = pd.to_datetime(clean[time_column], utc=True, format="ISO8601").max()
+            self.metrics.increment(
+                name, rows_fetched=len(records), rows_rejected=rejected_count, rows_pushed=len(new_rows),
+            )
+            self.metrics.update(
+                name,
+                last_success=time.time(),
+                last_duration_seconds=round(time.time() - started, 3),
+                last_error=None,
+                newest_row=newest.timestamp() if not pd.isna(newest) else None,
+            )
+            print(f"[{name}] fetched {len(records)}, pushed {len(new_rows)} new or changed, rejected {rejected_count}")
+            return entry["sync_interval"]
+        except SchemaDriftError as e:
+            # Retrying soon won't help until the schema is fixed, so wait a full interval
+            print(f"[{name}] ERROR: schema drift: {e}")
+            self.metrics.increment(name, errors=1)
+            self.metrics.update(name, last_error=f"schema drift: {e}", last_duration_seconds=round(time.time() - started, 3))
+            return entry["sync_interval"]
+        except Exception as e:
+            print(f"[{name}] ERROR: {e}")
+            print(traceback.format_exc())
+            self.metrics.increment(name, errors=1)
+            self.metrics.update(name, last_error=str(e), last_duration_seconds=round(time.time() - started, 3))
+            return min(RETRY_DELAY, entry["sync_interval"])
+
+    def stop(self, *args):
+        self.stop_event.set()
+
+    def run(self, port=DEFAULT_METRICS_PORT):
+        """Serve metrics and run the pull schedule until interrupted."""
+        server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+        server.metrics = self.metrics
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Metrics available at http://127.0.0.1:{server.server_port}/metrics")
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        try:
+            if not self.sql_only:
+                print("Checking which recent rows are already in the database...")
+                self.seed_seen()
+
+            # Every type runs once at startup, then on its own interval
+            next_run = {name: time.time() for name, _ in self.data_types}
+            while not self.stop_event.is_set():
+                now = time.time()
+                for name, entry in self.data_types:
+                    if next_run[name] > now or self.stop_event.is_set():
+                        continue
+                    next_run[name] = time.time() + self.sync_type(name, entry)
+                    self.metrics.update(name, next_run=next_run[name])
+
+                # Sleep until the next type is due (wakes immediately on stop)
+                self.stop_event.wait(max(0, min(next_run.values()) - time.time()))
+        finally:
+            print("Stopping sync daemon...")
+            server.shutdown()
+            server.server_close()
+            if self.conn is not None and not self.conn.closed:
+                self.conn.close()
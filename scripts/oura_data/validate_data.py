@@ -0,0 +1,187 @@
+# -------------------------------------------------------
+#  Oura CSV Validation
+# -------------------------------------------------------
+#   Checks a fetched CSV against the target table schema declared
+#   in data_types.py before any SQL is generated:
+#     1. Fails fast if the CSV no longer has the columns the table
+#        needs (schema drift)
+#     2. Coerces each column to its table type in one pass over the
+#        column (no per-row try/except)
+#     3. Writes rows that fail coercion to a quarantine CSV with the
+#        reason, and returns the rest ready for SQL generation
+# -------------------------------------------------------
+
+import ast
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_types import QUARANTINE_DIR, get_data_type, quarantine_path
+
+
+# How validated timestamps are written out (always UTC)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S+00:00"
+
+# Every int column in database.sql is a Postgres INTEGER
+INTEGER_MIN = -2**31
+INTEGER_MAX = 2**31 - 1
+
+
+class SchemaDriftError(ValueError):
+    """Raised when a CSV is missing columns its target table needs."""
+
+
+def resolve_columns(entry, header):
+    """
+    Map each table column in the registry entry to a CSV column in header.
+    Returns a list of (table column, CSV column, type, rule) for the columns
+    present, and raises SchemaDriftError if a non-optional column is missing.
+    """
+    resolved = []
+    missing = []
+    for table_column, csv_columns, kind, rule in entry["columns"]:
+        if isinstance(csv_columns, str):
+            csv_columns = (csv_columns,)
+        found = next((c for c in csv_columns if c in header), None)
+        if found is not None:
+            resolved.append((table_column, found, kind, rule))
+        elif rule != "optional":
+            missing.append(f"{table_column} (CSV column {' or '.join(csv_columns)})")
+
+    if missing:
+        raise SchemaDriftError(
+            f"{entry['csv_file']} does not match table {entry['table']}: missing {', '.join(missing)}. "
+            f"CSV columns are: {', '.join(c for c in header if c)}"
+        )
+    return resolved
+
+
+def to_json_text(text):
+    """
+    Parse an object or array written as JSON or as a Python repr (what the Oura
+    client gives us) and return it as JSON text, or None if it isn't valid.
+    """
+    try:
+        value = json.loads(text)
+    except ValueError:
+        try:
+            value = ast.literal_eval(text)
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            return None
+    if not isinstance(value, (dict, list)):
+        return None
+    try:
+        # NaN / Infinity aren't valid in JSONB
+        return json.dumps(value, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+
+
+def coerce_column(values, kind):
+    """
+    Coerce a column of strings to kind.
+    Returns (coerced values, mask of rows that had a value but could not be coerced).
+    Empty strings become missing values and are never counted as invalid.
+    """
+    blank = values.str.strip() == ""
+
+    if kind == "int":
+        numbers = pd.to_numeric(values.where(~blank), errors="coerce").astype("float64")
+        out_of_range = (numbers < INTEGER_MIN) | (numbers > INTEGER_MAX)
+        invalid = ~blank & (numbers.isna() | (numbers % 1 != 0) | out_of_range)
+        coerced = numbers.where(~invalid).astype("Int64")
+    elif kind == "float":
+        coerced = pd.to_numeric(values.where(~blank), errors="coerce").astype("float64")
+        # inf / nan can't be written as SQL literals
+        invalid = ~blank & ~np.isfinite(coerced)
+        coerced = coerced.where(~invalid)
+    elif kind == "date":
+        coerced = pd.to_datetime(values.where(~blank), format="%Y-%m-%d", errors="coerce")
+        invalid = ~blank & coerced.isna()
+        coerced = coerced.dt.strftime("%Y-%m-%d")
+    elif kind == "timestamp":
+        coerced = pd.to_datetime(values.where(~blank), format="ISO8601", utc=True, errors="coerce")
+        invalid = ~blank & coerced.isna()
+        coerced = coerced.dt.strftime(TIMESTAMP_FORMAT)
+    elif kind == "json":
+        # Parsed per value: a regex can't tell a valid repr from a broken one
+        coerced = values.where(~blank).map(to_json_text, na_action="ignore")
+        invalid = ~blank & coerced.isna()
+    elif kind == "text":
+        coerced = values.where(~blank)
+        invalid = pd.Series(False, index=values.index)
+    else:
+        raise ValueError(f"Unknown column type: {kind}")
+
+    return coerced, invalid
+
+
+def coerce_frame(name, df):
+    """
+    Coerce a DataFrame of text columns named after the table columns (e.g. rows read
+    back from the database) the same way validate_frame coerces a CSV. Nothing is quarantined.
+    """
+    entry = get_data_type(name)
+    clean = pd.DataFrame(index=df.index)
+    for table_column, _, kind, _ in entry["columns"]:
+        if table_column in df.columns:
+            clean[table_column], _ = coerce_column(df[table_column], kind)
+    return clean
+
+
+def read_text_csv(csv_file):
+    """Read a CSV with every value as text; coercion decides what is valid."""
+    return pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+
+
+def validate_csv(name, csv_file=None):
+    """
+    Validate and coerce the CSV for a data type.
+    Returns (DataFrame of table columns for the accepted rows, number of rejected rows).
+    Rejected rows are written to quarantine/<name>_rejects.csv with a reject_reason column.
+    """
+    entry = get_data_type(name)
+    return validate_frame(name, read_text_csv(csv_file or entry["csv_file"]))
+
+
+def validate_frame(name, df, quarantine_file=None):
+    """
+    Same as validate_csv, for a DataFrame of text columns already in memory.
+    Rejected rows go to quarantine_file if given (it is never removed), else to quarantine/<name>_rejects.csv.
+    """
+    entry = get_data_type(name)
+    columns = resolve_columns(entry, list(df.columns))
+
+    clean = pd.DataFrame(index=df.index)
+    reasons = pd.Series("", index=df.index)
+    for table_column, csv_column, kind, rule in columns:
+        coerced, invalid = coerce_column(df[csv_column], kind)
+        reasons = reasons.mask(invalid, reasons + f"{csv_column}: not a valid {kind}; ")
+        if rule == "required":
+            missing = coerced.isna() & ~invalid
+            reasons = reasons.mask(missing, reasons + f"{csv_column}: required value is empty; ")
+        clean[table_column] = coerced
+
+    rejected = reasons != ""
+    write_quarantine(name, df[rejected], reasons[rejected], quarantine_file)
+
+    return clean[~rejected], int(rejected.sum())
+
+
+def write_quarantine(name, rejects, reasons, path=None):
+    """Write rejected rows (with their CSV line number and reason) to the quarantine file."""
+    if rejects.empty:
+        # Don't leave rejects from an earlier prepare lying around
+        if path is None and os.path.exists(quarantine_path(name)):
+            os.remove(quarantine_path(name))
+        return
+    path = path or quarantine_path(name)
+
+    os.makedirs(QUARANTINE_DIR, exist_ok=True)
+    out = rejects.copy()
+    out.insert(0, "csv_line", rejects.index + 2)  # +1 for the header, +1 for 1-based lines
+    out["reject_reason"] = reasons.str.rstrip("; ")
+    out.to_csv(path, index=False)
+    print(f"  {len(out)} rejected rows written to {path}")